@@ -1,12 +1,14 @@
 import html
 import re
 import time
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterable, Optional
 
+import numpy as np
 import pandas as pd
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.neighbors import NearestNeighbors
 
 from license_plates import fetch_german_license_plates, resolve_license_plates_in_series
 from utils import make_status_printer
@@ -27,6 +29,253 @@ DEDUPLICATE_COLUMNS = [
     "salary",
 ]
 
+# Number of distinct company names scored per RapidFuzz ``cdist`` call in
+# :func:`consolidate_similar_companies`. Bounds the similarity matrix to
+# ``CONSOLIDATE_BLOCK_SIZE * n`` bytes; smaller blocks narrow the range of
+# name lengths each block has to be compared with.
+CONSOLIDATE_BLOCK_SIZE = 256
+
+# Minimum TF-IDF cosine similarity for two records to be compared in detail
+# by :func:`find_fuzzy_duplicates`.
+CANDIDATE_MIN_SIMILARITY = 0.6
+
+# Upper bound on the stored similarities per sparse matrix product in
+# :func:`generate_candidate_pairs`. Records are taken into a block until the
+# document frequencies of their terms add up to this many entries.
+CANDIDATE_BLOCK_NONZEROS = 1 << 22
+
+# HTML tags within a single line
+_HTML_TAG_RE = re.compile(r"<[^>\n]*>")
+
+# Whitespace as split by RapidFuzz's token scorers (NEL and NBSP excluded)
+_TOKEN_SEPARATOR_RE = re.compile(r"[^\S\x85\xa0]+")
+
+# German postal code (5 digits) with optional city at the end of a company
+# name: ", 12345 Stadt" / ", 12345" or, less common, " 12345 Stadt" without
+# comma (the city is required there so job IDs etc. are not matched).
+_PLZ_RE = re.compile(
+    r",\s*(?P<plz_comma>\d{5})(?:\s+[A-ZÄÖÜ][a-zäöüß\s-]+)?$"
+    r"|\s+(?P<plz_space>\d{5})\s+[A-ZÄÖÜ][a-zäöüß\s-]+$",
+    re.IGNORECASE,
+)
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Return a regex alternation matching exactly *words*.
+
+    Common prefixes are factored out ("Bo(?:chum|nn|ttrop)"), so the regex
+    engine does not compare them again for every word of a long list.
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}  # end of a word
+
+    def build(node: dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + build(child) for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ''
+        ends_here = '' in node
+        if len(branches) == 1 and not ends_here:
+            return branches[0]
+        pattern = '(?:' + '|'.join(branches) + ')'
+        return pattern + '?' if ends_here else pattern
+
+    return build(trie)
+
+
+# Patterns used by :func:`clean_company_field`, compiled once at import time.
+# Cities that are dropped from the end of a company name
+_COMPANY_CITIES = (
+    'Hamburg', 'Berlin', 'München', 'Köln', 'Frankfurt', 'Dresden', 'Leipzig',
+    'Hannover', 'Düsseldorf', 'Stuttgart', 'Dortmund', 'Essen', 'Bremen',
+    'Duisburg', 'Nürnberg', 'Bochum', 'Wuppertal', 'Bielefeld', 'Bonn',
+    'Münster', 'Karlsruhe', 'Mannheim', 'Augsburg', 'Wiesbaden',
+    'Gelsenkirchen', 'Mönchengladbach', 'Braunschweig', 'Chemnitz', 'Kiel',
+    'Aachen', 'Halle', 'Magdeburg', 'Freiburg', 'Krefeld', 'Lübeck', 'Mainz',
+    'Erfurt', 'Oberhausen', 'Rostock', 'Kassel', 'Hagen', 'Potsdam',
+    'Saarbrücken', 'Hamm', 'Mülheim', 'Ludwigshafen', 'Leverkusen',
+    'Oldenburg', 'Osnabrück', 'Solingen', 'Heidelberg', 'Herne', 'Neuss',
+    'Darmstadt', 'Paderborn', 'Regensburg', 'Ingolstadt', 'Würzburg', 'Fürth',
+    'Wolfsburg', 'Offenbach', 'Ulm', 'Heilbronn', 'Pforzheim', 'Göttingen',
+    'Bottrop', 'Trier', 'Recklinghausen', 'Reutlingen', 'Bremerhaven',
+    'Koblenz', 'Bergisch', 'Gladbach', 'Jena', 'Remscheid', 'Erlangen',
+    'Moers', 'Siegen', 'Hildesheim', 'Salzgitter', 'Leimen', 'Marburg',
+    'Kleve', 'Wildau', 'Minden', 'Oberhaching', 'Böhl-Iggelheim',
+    'Groß-Umstadt', 'Mainburg', 'Stralsund', 'Zella-Mehlis',
+)
+_TRAILING_DOT_RE = re.compile(r'\s*\.\s*$')
+_MULTI_COMMA_RE = re.compile(r',\s*,+')
+_TRAILING_COMMA_RE = re.compile(r',\s*$')
+_WHITESPACE_RE = re.compile(r'\s+')
+# Canonical spelling of common abbreviations and legal forms, keyed by the
+# spelling variant that is matched case-insensitively as a whole word.
+_COMPANY_ABBREVIATIONS = {
+    'gGmbH': 'gGmbH',
+    'GmbH': 'GmbH',
+    'AG': 'AG',
+    'e.V.': 'e.V.',
+    'eV': 'e.V.',
+    'LLP': 'LLP',
+    'Bibliothek': 'Bibliothek',
+    'Universität': 'Universität',
+    'Hochschule': 'Hochschule',
+    'Institut': 'Institut',
+    'Zentrum': 'Zentrum',
+    'Stadt': 'Stadt',
+}
+_COMPANY_ABBREVIATION_LOOKUP = {
+    variant.lower(): canonical for variant, canonical in _COMPANY_ABBREVIATIONS.items()
+}
+_COMPANY_ABBREVIATION_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, _COMPANY_ABBREVIATIONS)) + r')\b',
+    re.IGNORECASE,
+)
+# A standalone city after a comma at the end of the name
+_COMPANY_CITY_RE = re.compile(
+    r',\s+(?:' + _trie_pattern(_COMPANY_CITIES) + r')$', re.IGNORECASE
+)
+# Redundant descriptive text: the software vendor note is removed anywhere,
+# the other suffixes only at the end of the name. Each alternative has its
+# own group so that ``match.lastindex`` tells which one matched.
+_COMPANY_VENDOR_NOTE_RE = re.compile(
+    r',\s*Softwarehersteller für Bibliotheken', re.IGNORECASE
+)
+_COMPANY_TRAILING_RE = re.compile(
+    r',\s*(?:'
+    r'(Bibliothek)'
+    r'|(Stadtbibliothek)'
+    r'|(Universitätsbibliothek)'
+    r'|(Referat Benutzung)'
+    r'|(Dienstort\s+\w+)'
+    r'|(Standort\s+\w+)'
+    r'|(Ärztliche Zentralbibliothek)'
+    r'|(Hochschulbibliothek)'
+    r')$',
+    re.IGNORECASE,
+)
+
+
+# Patterns used by :func:`extract_jobdescription_info`, compiled once at import
+# time. They are matched against the lower-cased job description.
+_UNBEFRISTET_RE = re.compile(r"\bunbefristet\b")
+_BEFRISTETE_ERHOEHUNG_RE = re.compile(r"\bbefristete\s+erhöhung\b")
+_BEFRISTET_RE = re.compile(
+    r"\bbefristet\b"
+    r"(?:"
+        r"(?:\s+(?:bis|für|auf|als|zum|zur|in|mit|voraussichtlich|zunächst))?"
+        r"(?:\s+(?:zum|den|die|der|das|ein|eine|einen|zwei|drei))?"
+        r"(?:"
+            r"(?:\s+\d{1,2}\.?\s*(?:januar|februar|märz|april|mai|juni|juli|august|september|oktober|november|dezember|\d{1,2})\.?\s*\d{4})|"
+            r"(?:\s+\d+\s+(?:jahr|jahre|monat|monate|woche|wochen))|"
+            r"(?:\s+\w*vertretung)|"
+            r"(?:\s+elternzeit)|"
+            r"(?:\s+mutterschutz)|"
+            r"(?:\s+der\s+option\s+einer\s+unbefristeten\s+weiterbeschäftigung)"
+        r")*"
+    r")?"
+    r"(?![\s\w]*(?:tv-?l|e\s?\d+|vollzeit|teilzeit|stunden|arbeitszeit|wochenarbeitszeit|stellenausschreibung))",
+    re.IGNORECASE,
+)
+# Trailing words cut from an extracted fixed-term phrase in one pass. A
+# dangling "bis" is only dropped after a dangling preposition, as in "bis zu"
+_FIXEDTERM_TRAILING_RE = re.compile(
+    r'\s+(?:'
+        r'(?:bis\s+)?(?:zu|in|mit|und|oder)\s*$|'
+        r'bis\s*$|'
+        r'tv-?l.*$|'
+        r'e\s?\d+.*$|'
+        r'(?:vollzeit|teilzeit|in\s+vollzeit|in\s+teilzeit).*$|'
+        r'\d+\s*(?:%|prozent|stunden|std\.).*$'
+    r')',
+    re.IGNORECASE,
+)
+_VOLLZEIT_RE = re.compile(r"\bvollzeit\b")
+_TEILZEIT_RE = re.compile(r"\bteilzeit\b")
+_HOURS_PER_WEEK_RE = re.compile(
+    r"(\d+(?:[,\.]\d+)?)\s*(?:stunden|std\.?)\s*(?:/|pro|je|die)?\s*(?:woche|wo\.)"
+)
+_HOURS_PER_MONTH_RE = re.compile(
+    r"(\d+(?:[,\.]\d+)?)\s*(?:stunden|std\.?)\s*(?:/|pro|je|im)?\s*monat"
+)
+_PERCENT_RE = re.compile(r"(\d+(?:[,\.]\d+)?)\s*%")
+_BARE_HOURS_RE = re.compile(
+    r"(?:mit|von|umfang|arbeitszeit|wochenarbeitszeit)\s*(?:von)?\s*(\d+(?:[,\.]\d+)?)\s*(?:stunden|std\.?)"
+)
+_TARIFF_GRADE_RE = re.compile(
+    r"(?:tv-?[löd]|tv[öo]d|tv-?h)\s*(?:e|eg)\s*(\d{1,2}[üÜ]?(?:\s*[ab])?)"
+)
+_E_GRADE_RE = re.compile(r"\b(?:e|eg)\s*(\d{1,2}[üÜ]?(?:\s*[ab])?)\b")
+_A_GRADE_RE = re.compile(r"\ba\s*(\d{1,2})\b")
+_LEADING_NUMBER_RE = re.compile(r"(\d+)")
+_DIGIT_RE = re.compile(r"\d")
+_TV_L_RE = re.compile(r"TV-?[LÖD]+")
+_TVOED_RE = re.compile(r"TV[ÖO]D")
+_MINIJOB_RE = re.compile(r"450\s*(?:€|eur|euro)(?:-job)?")
+# Euro amounts, tried in this order; the first one has the decimal point
+# replaced by a space (e.g. "8 50 Euro")
+_EURO_AMOUNT_RES = [
+    re.compile(r"(\d{1,2})\s+(\d{2})\s*(?:€|eur|euro)\s*(?:/|pro|je)?\s*(?:stunde|std\.?|monat|jahr|woche|tag)"),
+    # X.XXX €/Euro per time period
+    re.compile(r"(\d{1,5}(?:[.,]\d{1,3})?)\s*(?:€|eur|euro)\s*(?:/|pro|je)?\s*(?:stunde|std\.?|monat|jahr|woche|tag)"),
+    # X €/h, X €/Std
+    re.compile(r"(\d{1,5}(?:[.,]\d{1,3})?)\s*€\s*/\s*(?:h|std\.?)"),
+    # Stundenlohn/Monatslohn X €
+    re.compile(r"(?:stunden|monats|jahres|wochen)lohn\s*(?:von)?\s*(\d{1,5}(?:[.,]\d{1,3})?)\s*(?:€|eur|euro)"),
+    # Simple amount without time period (but be careful)
+    re.compile(r"(\d{3,5})\s*(?:€|eur|euro)(?![/-]job)"),
+]
+_TRAILING_PUNCTUATION_RE = re.compile(r'[,;-]+$')
+# Pay grade and suffix in an upper-cased salary, e.g. "E9", "EG 9B"
+_SALARY_GRADE_RE = re.compile(r'E\s*G?\s*(\d+)\s*([A-Z]*)')
+
+def _canonical_abbreviation(match: re.Match[str]) -> str:
+    return _COMPANY_ABBREVIATION_LOOKUP[match.group(0).lower()]
+
+
+def _sort_tokens(texts: Iterable[str]) -> np.ndarray:
+    """Return *texts* with their whitespace-separated tokens sorted.
+
+    Comparing the results with ``fuzz.ratio`` gives the same score as
+    ``fuzz.token_sort_ratio`` on the original strings, so the tokenisation
+    only has to be done once per string instead of once per comparison.
+    """
+    return np.array(
+        [" ".join(sorted(filter(None, _TOKEN_SEPARATOR_RE.split(text)))) for text in texts],
+        dtype=object,
+    )
+
+
+def _take_by_codes(values: pd.Series, codes: np.ndarray, like: pd.Series) -> pd.Series:
+    """Spread per-unique *values* onto rows by factorized *codes*.
+
+    Code -1 (a missing value) becomes ``None``. The result has the index and
+    name of *like*.
+    """
+    taken = np.append(values.to_numpy(dtype=object), None)[codes]
+    return pd.Series(taken, index=like.index, name=like.name)
+
+
+def _all_pairs(size: int) -> np.ndarray:
+    """Return every index pair (i, j) with ``i < j < size`` as an (n, 2) array."""
+    return np.column_stack(np.triu_indices(size, 1)).astype(np.intp)
+
+
+def _strip_html(series: pd.Series) -> pd.Series:
+    """Remove HTML tags from *series* and decode HTML entities.
+
+    Missing values are left as they are.
+    """
+    present = series.notna()
+    values = series[present].astype(str).str.replace(_HTML_TAG_RE, "", regex=True)
+    stripped = series.astype(object)
+    stripped[present] = values.map(html.unescape)
+    return stripped
+
+
 def extract_plz_from_company(series: pd.Series) -> tuple[pd.Series, pd.Series]:
     """Extract postal codes from company names and return cleaned company names and PLZ.
     
@@ -40,42 +289,29 @@ def extract_plz_from_company(series: pd.Series) -> tuple[pd.Series, pd.Series]:
     tuple[pd.Series, pd.Series]
         Tuple of (cleaned_company_names, extracted_plz)
     """
-    
-    def extract_plz_and_clean(value):
-        if pd.isna(value):
-            return value, None
-        
-        value_str = str(value).strip()
-        extracted_plz = None
-        
-        # Extract German postal codes (5 digits) with optional city
-        # Patterns: ", 12345 Stadt" or ", 12345" at end of string
-        plz_pattern = r',\s*(\d{5})(?:\s+[A-ZÄÖÜ][a-zäöüß\s-]+)?$'
-        match = re.search(plz_pattern, value_str, flags=re.IGNORECASE)
-        
-        if match:
-            extracted_plz = match.group(1)
-            # Remove the entire PLZ+city part from company name
-            value_str = re.sub(plz_pattern, '', value_str, flags=re.IGNORECASE)
-        else:
-            # Try to find PLZ without comma (less common but happens)
-            # Pattern: " 12345 Stadt" or " 12345" at end, but be careful not to match job IDs etc.
-            plz_pattern_no_comma = r'\s+(\d{5})\s+[A-ZÄÖÜ][a-zäöüß\s-]+$'
-            match = re.search(plz_pattern_no_comma, value_str, flags=re.IGNORECASE)
-            if match:
-                extracted_plz = match.group(1)
-                value_str = re.sub(plz_pattern_no_comma, '', value_str, flags=re.IGNORECASE)
-        
-        return value_str.strip(), extracted_plz
-    
-    # Apply extraction to all values
-    results = series.apply(extract_plz_and_clean)
-    
-    # Separate company names and PLZ
-    company_names = pd.Series([result[0] for result in results], index=series.index)
-    plz_codes = pd.Series([result[1] for result in results], index=series.index)
-    
-    return company_names, plz_codes
+
+    # Company names repeat a lot, so the work is done once per distinct
+    # value and spread back onto the rows by code; code -1 marks missing
+    # values
+    codes, uniques = pd.factorize(series)
+    uniques = pd.Series(uniques, dtype=object)
+
+    # Work on stripped strings
+    values = uniques.astype(str).str.strip()
+
+    extracted = values.str.extract(_PLZ_RE)
+    plz_codes = extracted["plz_comma"].where(
+        extracted["plz_comma"].notna(), extracted["plz_space"]
+    )
+    # Names without a postal code get None, like missing names
+    plz_codes = plz_codes.astype(object).where(plz_codes.notna(), None)
+
+    # Remove the entire PLZ+city part from company names
+    company_names = values.str.replace(_PLZ_RE, "", regex=True).str.strip()
+
+    # Missing names are kept as they are
+    companies = _take_by_codes(company_names, codes, series).where(codes >= 0, series)
+    return companies, _take_by_codes(plz_codes, codes, series)
 
 
 def clean_company_field(series: pd.Series) -> pd.Series:
@@ -100,58 +336,41 @@ def clean_company_field(series: pd.Series) -> pd.Series:
             return value
         
         value_str = str(value).strip()
-        
+
         # 1. Remove standalone cities at end (Hamburg, Berlin, etc.)
         # Only remove if they appear after a comma
-        city_only_pattern = r',\s+(?:Hamburg|Berlin|München|Köln|Frankfurt|Dresden|Leipzig|Hannover|Düsseldorf|Stuttgart|Dortmund|Essen|Bremen|Duisburg|Nürnberg|Bochum|Wuppertal|Bielefeld|Bonn|Münster|Karlsruhe|Mannheim|Augsburg|Wiesbaden|Gelsenkirchen|Mönchengladbach|Braunschweig|Chemnitz|Kiel|Aachen|Halle|Magdeburg|Freiburg|Krefeld|Lübeck|Mainz|Erfurt|Oberhausen|Rostock|Kassel|Hagen|Potsdam|Saarbrücken|Hamm|Mülheim|Ludwigshafen|Leverkusen|Oldenburg|Osnabrück|Solingen|Heidelberg|Herne|Neuss|Darmstadt|Paderborn|Regensburg|Ingolstadt|Würzburg|Fürth|Wolfsburg|Offenbach|Ulm|Heilbronn|Pforzheim|Göttingen|Bottrop|Trier|Recklinghausen|Reutlingen|Bremerhaven|Koblenz|Bergisch|Gladbach|Jena|Remscheid|Erlangen|Moers|Siegen|Hildesheim|Salzgitter|Leimen|Marburg|Kleve|Wildau|Minden|Oberhaching|Böhl-Iggelheim|Groß-Umstadt|Mainburg|Stralsund|Zella-Mehlis)$'
-        value_str = re.sub(city_only_pattern, '', value_str, flags=re.IGNORECASE)
-        
+        value_str = _COMPANY_CITY_RE.sub('', value_str)
+
         # 2. Clean formatting and punctuation
-        value_str = re.sub(r'\s*\.\s*$', '', value_str)  # Remove trailing dots
-        value_str = re.sub(r',\s*,+', ',', value_str)     # Remove multiple commas
-        value_str = re.sub(r',\s*$', '', value_str)       # Remove trailing commas
-        value_str = re.sub(r'\s+', ' ', value_str)        # Normalize whitespace
-        value_str = re.sub(r'-\s+', '- ', value_str)      # Normalize hyphens
-        
+        value_str = _TRAILING_DOT_RE.sub('', value_str)    # Remove trailing dots
+        value_str = _MULTI_COMMA_RE.sub(',', value_str)    # Remove multiple commas
+        value_str = _TRAILING_COMMA_RE.sub('', value_str)  # Remove trailing commas
+        # Normalize whitespace; this also leaves hyphens followed by exactly
+        # one space, so no separate hyphen pass is needed
+        value_str = _WHITESPACE_RE.sub(' ', value_str)
+
         # 3. Standardize common abbreviations and legal forms
-        abbreviations = {
-            r'\bgGmbH\b': 'gGmbH',
-            r'\bGmbH\b': 'GmbH', 
-            r'\bAG\b': 'AG',
-            r'\be\.V\.\b': 'e.V.',
-            r'\beV\b': 'e.V.',
-            r'\bLLP\b': 'LLP',
-            r'\bBibliothek\b': 'Bibliothek',
-            r'\bUniversität\b': 'Universität',
-            r'\bHochschule\b': 'Hochschule',
-            r'\bInstitut\b': 'Institut',
-            r'\bZentrum\b': 'Zentrum',
-            r'\bStadt\b': 'Stadt'
-        }
-        
-        for pattern, replacement in abbreviations.items():
-            value_str = re.sub(pattern, replacement, value_str, flags=re.IGNORECASE)
-        
-        # 4. Remove redundant descriptive text that often appears at the end
-        redundant_patterns = [
-            r',\s*Softwarehersteller für Bibliotheken',
-            r',\s*Bibliothek$',
-            r',\s*Stadtbibliothek$',
-            r',\s*Universitätsbibliothek$',
-            r',\s*Referat Benutzung$',
-            r',\s*Dienstort\s+\w+$',
-            r',\s*Standort\s+\w+$',
-            r',\s*Ärztliche Zentralbibliothek$',
-            r',\s*Hochschulbibliothek$'
-        ]
-        
-        for pattern in redundant_patterns:
-            value_str = re.sub(pattern, '', value_str, flags=re.IGNORECASE)
-        
+        value_str = _COMPANY_ABBREVIATION_RE.sub(_canonical_abbreviation, value_str)
+
+        # 4. Remove redundant descriptive text that often appears at the end.
+        # Stacked suffixes (", Hochschulbibliothek, Standort X") are removed
+        # as long as each one comes later in the pattern than the last.
+        value_str = _COMPANY_VENDOR_NOTE_RE.sub('', value_str)
+        last_suffix = 0
+        match = _COMPANY_TRAILING_RE.search(value_str)
+        while match and match.lastindex > last_suffix:
+            value_str = value_str[:match.start()]
+            last_suffix = match.lastindex
+            match = _COMPANY_TRAILING_RE.search(value_str)
+
         return value_str.strip()
     
-    # First pass: clean individual entries
-    cleaned_series = series.apply(clean_single_company)
+    # First pass: clean individual entries. Company names repeat a lot, so
+    # every distinct name is cleaned only once and mapped back onto the rows.
+    cleaned_names = {
+        name: clean_single_company(name) for name in pd.unique(series.dropna())
+    }
+    cleaned_series = series.map(cleaned_names)
     
     # Second pass: consolidate similar entries using fuzzy matching
     cleaned_series = consolidate_similar_companies(cleaned_series)
@@ -178,264 +397,254 @@ def consolidate_similar_companies(series: pd.Series, threshold: int = 85) -> pd.
     # Get unique values and their counts
     value_counts = series.value_counts()
     unique_values = value_counts.index.tolist()
-    
-    # Group similar values
+    lowered = [str(value).lower() for value in unique_values]
+    n = len(unique_values)
+
+    # Find all pairs of names that reach the threshold. ``fuzz.ratio`` can
+    # only reach it if the shorter name has at least threshold / (200 -
+    # threshold) of the longer name's length, so names are sorted by length
+    # and each block is scored by RapidFuzz (on all cores) against the names
+    # of compatible length only. Blocks keep the memory bounded.
+    lengths = np.fromiter(map(len, lowered), dtype=np.intp, count=n)
+    by_length = np.argsort(lengths, kind='stable')
+    sorted_lengths = lengths[by_length]
+    sorted_lowered = [lowered[i] for i in by_length]
+    pair_left = []
+    pair_right = []
+
+    for start in range(0, n, CONSOLIDATE_BLOCK_SIZE):
+        stop = min(start + CONSOLIDATE_BLOCK_SIZE, n)
+        if threshold > 0:
+            max_length = sorted_lengths[stop - 1] * (200 - threshold) / threshold
+            end = int(np.searchsorted(sorted_lengths, max_length, side='right'))
+        else:
+            end = n
+        similarity = process.cdist(
+            sorted_lowered[start:stop],
+            sorted_lowered[start:end],
+            scorer=fuzz.ratio,
+            score_cutoff=threshold,
+            dtype=np.uint8,
+            workers=-1,
+        )
+        rows, cols = np.nonzero(similarity >= threshold)
+        later = cols > rows  # each unordered pair once, without the diagonal
+        left = by_length[rows[later] + start]
+        right = by_length[cols[later] + start]
+        pair_left.append(np.minimum(left, right))
+        pair_right.append(np.maximum(left, right))
+
+    pair_left = np.concatenate(pair_left) if pair_left else np.empty(0, dtype=np.intp)
+    pair_right = np.concatenate(pair_right) if pair_right else np.empty(0, dtype=np.intp)
+    pair_order = np.lexsort((pair_right, pair_left))
+    pair_left = pair_left[pair_order]
+    pair_right = pair_right[pair_order]
+    bounds = np.searchsorted(pair_left, np.arange(n + 1))
+
+    # Group similar values. Each unused value starts a new group and absorbs
+    # all later unused values that reach the threshold.
     groups = []
-    used = set()
-    
-    for i, value1 in enumerate(unique_values):
-        if value1 in used or pd.isna(value1):
+    used = np.zeros(n, dtype=bool)
+
+    for i in range(n):
+        if used[i]:
             continue
-            
-        group = [value1]
-        used.add(value1)
-        
-        for j, value2 in enumerate(unique_values[i+1:], i+1):
-            if value2 in used or pd.isna(value2):
-                continue
-                
-            # Use fuzzy matching to compare names
-            similarity = int(fuzz.ratio(str(value1).lower(), str(value2).lower()))
-            
-            if similarity >= threshold:
-                group.append(value2)
-                used.add(value2)
-        
-        if len(group) > 1:
-            groups.append(group)
-    
-    # Create mapping from similar names to the most frequent one
-    name_mapping = {}
-    for group in groups:
-        # Choose the most frequent name as canonical
-        group_counts = [(name, value_counts[name]) for name in group]
-        group_counts.sort(key=lambda x: (-x[1], len(x[0])))  # Most frequent, then shortest
-        canonical = group_counts[0][0]
-        
-        for name in group:
-            name_mapping[name] = canonical
-    
-    # Apply mapping
-    def apply_mapping(value):
-        if pd.isna(value):
-            return value
-        return name_mapping.get(value, value)
-    
-    return series.apply(apply_mapping)
+        used[i] = True
 
+        matches = pair_right[bounds[i]:bounds[i + 1]]
+        matches = matches[~used[matches]]
+        if matches.size == 0:
+            continue
 
+        used[matches] = True
+        groups.append(np.concatenate(([i], matches)))
 
-def extract_jobdescription_info(series: pd.Series) -> tuple[pd.Series, pd.Series, pd.Series]:
-    """Extract fixed-term status, working hours, and salary from a jobdescription column.
+    # Create mapping from similar names to the most frequent one, then the
+    # shortest; further ties go to the name that started the group
+    counts = value_counts.to_numpy()
+    name_lengths = np.fromiter(
+        (len(str(value)) for value in unique_values), dtype=np.intp, count=n
+    )
+    name_mapping = {}
+    for members in groups:
+        best = np.lexsort((name_lengths[members], -counts[members]))[0]
+        canonical = unique_values[members[best]]
+        for j in members.tolist():
+            name_mapping[unique_values[j]] = canonical
+    
+    # Apply mapping; names outside any group are kept as they are
+    mapped = series.map(name_mapping)
+    return mapped.where(mapped.notna(), series)
 
-    Parameters
-    ----------
-    series:
-        Series containing textual job descriptions.
 
-    Returns
-    -------
-    tuple[pd.Series, pd.Series, pd.Series]
-        Tuple of (fixedterm, workinghours, salary) series.
-    """
 
-    def parse_terms(value: Any) -> tuple[Optional[str], Optional[str], Optional[str]]:
-        if pd.isna(value):
-            return None, None, None
+def _parse_job_terms(value: Any) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return (fixedterm, workinghours, salary) found in one job description."""
+    if pd.isna(value):
+        return None, None, None
 
-        text = str(value)
-        lower = text.lower()
+    text = str(value)
+    lower = text.lower()
 
-        fixedterm: Optional[str] = None
-        workinghours: Optional[str] = None
-        salary: Optional[str] = None
+    fixedterm: Optional[str] = None
+    workinghours: Optional[str] = None
+    salary: Optional[str] = None
 
-        # Fixed-term detection
-        match = re.search(r"\bunbefristet\b", lower)
+    # Fixed-term detection
+    if "befrist" in lower:
+        match = _UNBEFRISTET_RE.search(lower)
         if match:
             fixedterm = text[match.start():match.end()]
         else:
-            if not re.search(r"\bbefristete\s+erhöhung\b", lower):
-                pattern = (
-                    r"\bbefristet\b"
-                    r"(?:"
-                        r"(?:\s+(?:bis|für|auf|als|zum|zur|in|mit|voraussichtlich|zunächst))?"
-                        r"(?:\s+(?:zum|den|die|der|das|ein|eine|einen|zwei|drei))?"
-                        r"(?:"
-                            r"(?:\s+\d{1,2}\.?\s*(?:januar|februar|märz|april|mai|juni|juli|august|september|oktober|november|dezember|\d{1,2})\.?\s*\d{4})|"
-                            r"(?:\s+\d+\s+(?:jahr|jahre|monat|monate|woche|wochen))|"
-                            r"(?:\s+\w*vertretung)|"
-                            r"(?:\s+elternzeit)|"
-                            r"(?:\s+mutterschutz)|"
-                            r"(?:\s+der\s+option\s+einer\s+unbefristeten\s+weiterbeschäftigung)"
-                        r")*"
-                    r")?"
-                )
-                
-                full_pattern = pattern + r"(?![\s\w]*(?:tv-?l|e\s?\d+|vollzeit|teilzeit|stunden|arbeitszeit|wochenarbeitszeit|stellenausschreibung))"
-                
-                match = re.search(full_pattern, lower, re.IGNORECASE)
+            if not _BEFRISTETE_ERHOEHUNG_RE.search(lower):
+                match = _BEFRISTET_RE.search(lower)
                 if match:
                     extracted = text[match.start():match.end()]
-                    extracted = re.sub(r'\s+(?:zu|in|mit|und|oder)\s*$', '', extracted, flags=re.IGNORECASE)
-                    extracted = re.sub(r'\s+bis\s*$', '', extracted, flags=re.IGNORECASE)
-                    extracted = re.sub(r'\s+tv-?l.*$', '', extracted, flags=re.IGNORECASE)
-                    extracted = re.sub(r'\s+e\s?\d+.*$', '', extracted, flags=re.IGNORECASE)
-                    extracted = re.sub(r'\s+(?:vollzeit|teilzeit|in\s+vollzeit|in\s+teilzeit).*$', '', extracted, flags=re.IGNORECASE)
-                    extracted = re.sub(r'\s+\d+\s*(?:%|prozent|stunden|std\.).*$', '', extracted, flags=re.IGNORECASE)
-                    
-                    fixedterm = extracted.strip()
-
-        # Working hours detection
-        if re.search(r"\bvollzeit\b", lower):
-            workinghours = "Vollzeit"
-        elif re.search(r"\bteilzeit\b", lower):
-            workinghours = "Teilzeit"
+                    fixedterm = _FIXEDTERM_TRAILING_RE.sub('', extracted).strip()
+
+    # Working hours detection
+    # Cheap substring checks skip patterns that cannot match this text
+    mentions_hours = "stunden" in lower or "std" in lower
+    if "vollzeit" in lower and _VOLLZEIT_RE.search(lower):
+        workinghours = "Vollzeit"
+    elif "teilzeit" in lower and _TEILZEIT_RE.search(lower):
+        workinghours = "Teilzeit"
+    else:
+        hours_week_match = mentions_hours and _HOURS_PER_WEEK_RE.search(lower)
+        if hours_week_match:
+            try:
+                hours = float(hours_week_match.group(1).replace(',', '.'))
+                workinghours = "Vollzeit" if hours >= 36 else "Teilzeit"
+            except ValueError:
+                pass
         else:
-            hours_week_match = re.search(
-                r"(\d+(?:[,\.]\d+)?)\s*(?:stunden|std\.?)\s*(?:/|pro|je|die)?\s*(?:woche|wo\.)",
-                lower
-            )
-            if hours_week_match:
+            hours_month_match = mentions_hours and _HOURS_PER_MONTH_RE.search(lower)
+            if hours_month_match:
                 try:
-                    hours = float(hours_week_match.group(1).replace(',', '.'))
-                    workinghours = "Vollzeit" if hours >= 36 else "Teilzeit"
+                    hours_month = float(hours_month_match.group(1).replace(',', '.'))
+                    hours_week = hours_month / 4.33
+                    workinghours = "Vollzeit" if hours_week >= 36 else "Teilzeit"
                 except ValueError:
                     pass
             else:
-                hours_month_match = re.search(
-                    r"(\d+(?:[,\.]\d+)?)\s*(?:stunden|std\.?)\s*(?:/|pro|je|im)?\s*monat",
-                    lower
-                )
-                if hours_month_match:
+                percent_match = "%" in lower and _PERCENT_RE.search(lower)
+                if percent_match:
                     try:
-                        hours_month = float(hours_month_match.group(1).replace(',', '.'))
-                        hours_week = hours_month / 4.33
-                        workinghours = "Vollzeit" if hours_week >= 36 else "Teilzeit"
+                        percent = float(percent_match.group(1).replace(',', '.'))
+                        workinghours = "Vollzeit" if percent >= 90 else "Teilzeit"
                     except ValueError:
                         pass
                 else:
-                    percent_match = re.search(r"(\d+(?:[,\.]\d+)?)\s*%", lower)
-                    if percent_match:
+                    bare_hours_match = mentions_hours and _BARE_HOURS_RE.search(lower)
+                    if bare_hours_match:
                         try:
-                            percent = float(percent_match.group(1).replace(',', '.'))
-                            workinghours = "Vollzeit" if percent >= 90 else "Teilzeit"
+                            hours = float(bare_hours_match.group(1).replace(',', '.'))
+                            if hours <= 60:
+                                workinghours = "Vollzeit" if hours >= 36 else "Teilzeit"
                         except ValueError:
                             pass
-                    else:
-                        bare_hours_match = re.search(
-                            r"(?:mit|von|umfang|arbeitszeit|wochenarbeitszeit)\s*(?:von)?\s*(\d+(?:[,\.]\d+)?)\s*(?:stunden|std\.?)",
-                            lower
-                        )
-                        if bare_hours_match:
-                            try:
-                                hours = float(bare_hours_match.group(1).replace(',', '.'))
-                                if hours <= 60:
-                                    workinghours = "Vollzeit" if hours >= 36 else "Teilzeit"
-                            except ValueError:
-                                pass
-
-        # Salary detection
-        # Priority 1: Look for TV-L, TVöD, TV-öD patterns with valid pay grades
-        tv_match = re.search(
-            r"(?:tv-?[löd]|tv[öo]d|tv-?h)\s*(?:e|eg)\s*(\d{1,2}[üÜ]?(?:\s*[ab])?)",
-            lower
-        )
-        if tv_match:
-            grade = tv_match.group(1)
-            grade_num = re.match(r"(\d+)", grade)
+
+    # Salary detection
+    # Priority 1: Look for TV-L, TVöD, TV-öD patterns with valid pay grades
+    tv_match = "tv" in lower and _TARIFF_GRADE_RE.search(lower)
+    if tv_match:
+        grade = tv_match.group(1)
+        grade_num = _LEADING_NUMBER_RE.match(grade)
+        if grade_num and 1 <= int(grade_num.group(1)) <= 15:
+            full_match = text[tv_match.start():tv_match.end()]
+            salary = _WHITESPACE_RE.sub(' ', full_match.upper())
+            salary = _TV_L_RE.sub('TV-L', salary)
+            salary = _TVOED_RE.sub('TVöD', salary)
+    
+    if not salary:
+        # Priority 2: Look for E/EG groups (without TV-L prefix)
+        e_match = _E_GRADE_RE.search(lower)
+        if e_match:
+            grade = e_match.group(1)
+            grade_num = _LEADING_NUMBER_RE.match(grade)
             if grade_num and 1 <= int(grade_num.group(1)) <= 15:
-                full_match = text[tv_match.start():tv_match.end()]
-                salary = re.sub(r'\s+', ' ', full_match.upper())
-                salary = re.sub(r'TV-?[LÖD]+', 'TV-L', salary)
-                salary = re.sub(r'TV[ÖO]D', 'TVöD', salary)
-        
-        if not salary:
-            # Priority 2: Look for E/EG groups (without TV-L prefix)
-            e_match = re.search(
-                r"\b(?:e|eg)\s*(\d{1,2}[üÜ]?(?:\s*[ab])?)\b",
-                lower
-            )
-            if e_match:
-                grade = e_match.group(1)
-                grade_num = re.match(r"(\d+)", grade)
-                if grade_num and 1 <= int(grade_num.group(1)) <= 15:
-                    after_pos = e_match.end()
-                    if after_pos < len(lower):
-                        following_text = lower[after_pos:min(after_pos + 10, len(lower))]
-                        if not re.match(r'\d', following_text):
-                            full_match = text[e_match.start():e_match.end()]
-                            if 'eg' in lower[e_match.start():e_match.end()]:
-                                salary = f"EG {grade.upper()}"
-                            else:
-                                salary = f"E {grade.upper()}"
-        
-        if not salary:
-            # Priority 3: Look for A groups (Beamtenbesoldung)
-            a_match = re.search(
-                r"\ba\s*(\d{1,2})\b",
-                lower
-            )
-            if a_match:
-                grade = a_match.group(1)
-                if 1 <= int(grade) <= 16:
-                    salary = f"A {grade}"
-        
-        if not salary:
-            # Priority 4: IMPROVED Euro amount detection
-            
-            # Special case: 450 Euro-Job / 450-Euro-Job (Minijob)
-            minijob_match = re.search(r"450\s*(?:€|eur|euro)(?:-job)?", lower)
-            if minijob_match:
-                salary = "450 Euro-Job"
-            else:
-                euro_patterns = [
-                    # Pattern for amounts with space instead of decimal point (e.g., "8 50 Euro")
-                    r"(\d{1,2})\s+(\d{2})\s*(?:€|eur|euro)\s*(?:/|pro|je)?\s*(?:stunde|std\.?|monat|jahr|woche|tag)",
-                    # X.XXX €/Euro per time period
-                    r"(\d{1,5}(?:[.,]\d{1,3})?)\s*(?:€|eur|euro)\s*(?:/|pro|je)?\s*(?:stunde|std\.?|monat|jahr|woche|tag)",
-                    # X €/h, X €/Std
-                    r"(\d{1,5}(?:[.,]\d{1,3})?)\s*€\s*/\s*(?:h|std\.?)",
-                    # Stundenlohn/Monatslohn X €
-                    r"(?:stunden|monats|jahres|wochen)lohn\s*(?:von)?\s*(\d{1,5}(?:[.,]\d{1,3})?)\s*(?:€|eur|euro)",
-                    # Simple amount without time period (but be careful)
-                    r"(\d{3,5})\s*(?:€|eur|euro)(?![/-]job)",
-                ]
-                
-                for pattern in euro_patterns:
-                    euro_match = re.search(pattern, lower)
-                    if euro_match:
-                        # Extract the original text
-                        start = euro_match.start()
-                        end = euro_match.end()
-                        
-                        # For the special case with space instead of decimal
-                        if pattern == euro_patterns[0] and euro_match.group(1) and euro_match.group(2):
-                            # Reconstruct with decimal point
-                            amount = f"{euro_match.group(1)},{euro_match.group(2)}"
-                            remaining = lower[euro_match.start() + len(euro_match.group(1)) + 1 + len(euro_match.group(2)):euro_match.end()]
-                            salary = f"{amount}{text[euro_match.start() + len(euro_match.group(1)) + 1 + len(euro_match.group(2)):euro_match.end()]}"
+                after_pos = e_match.end()
+                if after_pos < len(lower):
+                    following_text = lower[after_pos:min(after_pos + 10, len(lower))]
+                    if not _DIGIT_RE.match(following_text):
+                        full_match = text[e_match.start():e_match.end()]
+                        if 'eg' in lower[e_match.start():e_match.end()]:
+                            salary = f"EG {grade.upper()}"
                         else:
-                            salary = text[start:end]
-                        
-                        # Clean up the extracted salary
-                        salary = re.sub(r'\s+', ' ', salary).strip()
-                        
-                        # Remove trailing punctuation (comma, semicolon, dash) but keep dash in "Euro-Job"
-                        salary = re.sub(r'[,;-]+$', '', salary)
-                        
-                        # Standardize Euro notation
-                        salary = salary.replace('eur ', 'Euro ')
-                        salary = salary.replace('€', 'Euro')
-                        
-                        break
+                            salary = f"E {grade.upper()}"
+    
+    if not salary:
+        # Priority 3: Look for A groups (Beamtenbesoldung)
+        a_match = _A_GRADE_RE.search(lower)
+        if a_match:
+            grade = a_match.group(1)
+            if 1 <= int(grade) <= 16:
+                salary = f"A {grade}"
+    
+    if not salary and ("€" in lower or "eur" in lower):
+        # Priority 4: IMPROVED Euro amount detection
+        
+        # Special case: 450 Euro-Job / 450-Euro-Job (Minijob)
+        minijob_match = _MINIJOB_RE.search(lower)
+        if minijob_match:
+            salary = "450 Euro-Job"
+        else:
+            for euro_re in _EURO_AMOUNT_RES:
+                euro_match = euro_re.search(lower)
+                if euro_match:
+                    # Extract the original text
+                    start = euro_match.start()
+                    end = euro_match.end()
+                    
+                    # For the special case with space instead of decimal
+                    if euro_re is _EURO_AMOUNT_RES[0] and euro_match.group(1) and euro_match.group(2):
+                        # Reconstruct with decimal point
+                        amount = f"{euro_match.group(1)},{euro_match.group(2)}"
+                        remaining = lower[euro_match.start() + len(euro_match.group(1)) + 1 + len(euro_match.group(2)):euro_match.end()]
+                        salary = f"{amount}{text[euro_match.start() + len(euro_match.group(1)) + 1 + len(euro_match.group(2)):euro_match.end()]}"
+                    else:
+                        salary = text[start:end]
+                    
+                    # Clean up the extracted salary
+                    salary = _WHITESPACE_RE.sub(' ', salary).strip()
+                    
+                    # Remove trailing punctuation (comma, semicolon, dash) but keep dash in "Euro-Job"
+                    salary = _TRAILING_PUNCTUATION_RE.sub('', salary)
+                    
+                    # Standardize Euro notation
+                    salary = salary.replace('eur ', 'Euro ')
+                    salary = salary.replace('€', 'Euro')
+                    
+                    break
+
+    return fixedterm, workinghours, salary
+
+
+def extract_jobdescription_info(series: pd.Series) -> tuple[pd.Series, pd.Series, pd.Series]:
+    """Extract fixed-term status, working hours, and salary from a jobdescription column.
 
-        return fixedterm, workinghours, salary
+    Parameters
+    ----------
+    series:
+        Series containing textual job descriptions.
 
-    results = series.apply(parse_terms)
-    fixedterm_series = pd.Series([r[0] for r in results], index=series.index)
-    workinghours_series = pd.Series([r[1] for r in results], index=series.index)
-    salary_series = pd.Series([r[2] for r in results], index=series.index)
+    Returns
+    -------
+    tuple[pd.Series, pd.Series, pd.Series]
+        Tuple of (fixedterm, workinghours, salary) series.
+    """
+
+    # Reposted ads share their text, so each distinct description is parsed
+    # once; the trailing None slot is picked up by code -1 (missing values)
+    codes, uniques = pd.factorize(series)
+    results = [_parse_job_terms(value) for value in uniques]
+    results.append((None, None, None))
+    fixedterms, workinghours, salaries = (
+        np.array(column, dtype=object)[codes] for column in zip(*results)
+    )
+    fixedterm_series = pd.Series(fixedterms, index=series.index)
+    workinghours_series = pd.Series(workinghours, index=series.index)
+    salary_series = pd.Series(salaries, index=series.index)
     return fixedterm_series, workinghours_series, salary_series
 
 
@@ -452,17 +661,18 @@ def clean_dataframe(
     df:
         Input DataFrame to clean. Only ``object`` columns are processed.
     progress_callback:
-        Optional function receiving the percentage of processed columns as a
-        ``float`` between 0 and 100.
+        Optional function receiving the overall progress as a ``float``
+        between 0 and 100.
     status_callback:
         Optional function receiving status messages as ``str``.
     """
 
     _status = make_status_printer(status_callback)
 
-    cleaned = df.copy()
+    # Only whole columns are replaced below, never written in place, so the
+    # untouched (e.g. numeric) columns can share their data with *df*
+    cleaned = df.copy(deep=False)
     object_cols = cleaned.select_dtypes(include=["object"]).columns
-    total = len(object_cols)
 
     # Fetch license plate mapping once at the beginning
     license_plate_map = {}
@@ -490,30 +700,27 @@ def clean_dataframe(
 
         _status(f"PLZ extrahiert: {plz_extracted.notna().sum()} Einträge gefunden")
     
-    for idx, col in enumerate(object_cols, start=1):
-        # HTML cleaning (original functionality)
-        cleaned[col] = cleaned[col].apply(
-            lambda x: html.unescape(re.sub(r"<.*?>", "", str(x)))
-            if pd.notna(x)
-            else x
+    # HTML cleaning of all text columns
+    for col in object_cols:
+        cleaned[col] = _strip_html(cleaned[col])
+    if progress_callback:
+        progress_callback(20.0)
+
+    # License plate resolution for location column
+    if 'location' in object_cols and license_plate_map:
+        cleaned['location'] = resolve_license_plates_in_series(
+            cleaned['location'], license_plate_map
         )
-        
-        # License plate resolution for location column
-        if col == 'location' and license_plate_map:
-            cleaned[col] = resolve_license_plates_in_series(cleaned[col], license_plate_map)
-        
-        # Company name cleaning and standardization (after PLZ extraction)
-        if col == 'company':
-            if progress_callback:
-                progress = 15.0 + (idx / total * 75.0)  # Show progress for company cleaning
-                progress_callback(progress)
-            _status("Bereinige und standardisiere Firmennamen...")
-            cleaned[col] = clean_company_field(cleaned[col])
-        
-        if progress_callback and total:
-            # Reserve 10% for license plates + PLZ, use remaining 90% for processing
-            progress = 10.0 + (idx / total * 90.0)
-            progress_callback(progress)
+
+    # Company name cleaning and standardization (after PLZ extraction)
+    if 'company' in object_cols:
+        if progress_callback:
+            progress_callback(25.0)
+        _status("Bereinige und standardisiere Firmennamen...")
+        cleaned['company'] = clean_company_field(cleaned['company'])
+
+    if progress_callback:
+        progress_callback(50.0)
 
     if 'jobdescription' in cleaned.columns:
         fixedterm, workinghours, salary = extract_jobdescription_info(cleaned['jobdescription'])
@@ -530,11 +737,21 @@ def generate_candidate_pairs(
     df: pd.DataFrame,
     fuzzy_fields: set[str],
     n_neighbors: int = 5,
-) -> set[tuple[int, int]]:
+    min_similarity: float = CANDIDATE_MIN_SIMILARITY,
+) -> np.ndarray:
     """Generate potential duplicate candidate pairs using TF-IDF and nearest neighbors.
 
-    This reduces the number of comparisons from O(n^2) to roughly O(n * k),
-    where ``k`` is the number of neighbors considered per record.
+    Each record is paired with its ``n_neighbors - 1`` nearest neighbours and,
+    in addition, with every record whose cosine similarity reaches
+    ``min_similarity``. The radius search keeps clusters of near-identical
+    postings that are larger than ``n_neighbors`` complete, while the number
+    of comparisons stays roughly O(n * k) for ordinary data.
+
+    The TF-IDF rows are L2-normalised, so cosine similarities are obtained
+    from a block-wise sparse matrix product. Records that share no term
+    have similarity 0; a record with fewer than ``n_neighbors - 1`` similar
+    records, e.g. one whose text has no term at all, is paired with records
+    of similarity 0 in positional order instead.
 
     Parameters
     ----------
@@ -544,25 +761,32 @@ def generate_candidate_pairs(
         Columns used to build the textual representation for similarity search.
     n_neighbors : int, optional
         Number of nearest neighbours to retrieve per record. Includes the record
-        itself, so the number of candidates per row is ``n_neighbors - 1``.
+        itself, so the number of candidates per row is at least
+        ``n_neighbors - 1``.
+    min_similarity : float, optional
+        Cosine similarity (0-1) from which records always become candidates.
 
     Returns
     -------
-    set[tuple[int, int]]
-        Set of index pairs (i, j) with ``i < j`` representing candidate
-        comparisons. If TF-IDF cannot be computed (e.g. empty vocabulary), the
-        function falls back to a full pairwise comparison.
+    np.ndarray
+        Array of shape ``(n_pairs, 2)`` holding the distinct positional index
+        pairs (i, j) with ``i < j`` that should be compared, sorted by i, then
+        j. If TF-IDF cannot be computed (e.g. empty vocabulary), the function
+        falls back to a full pairwise comparison.
     """
 
     size = len(df)
-    if size < 2:
-        return set()
 
-    if not fuzzy_fields:
-        return {(i, j) for i in range(size) for j in range(i + 1, size)}
+    # Small groups are compared completely; every record is among the
+    # nearest neighbours of every other one anyway
+    if not fuzzy_fields or size <= n_neighbors:
+        return _all_pairs(size)
 
-    # Build corpus from fuzzy fields
-    corpus = df[list(fuzzy_fields)].fillna("").agg(" ".join, axis=1)
+    # Build corpus from fuzzy fields, concatenated column-wise
+    corpus = None
+    for col in fuzzy_fields:
+        values = df[col].fillna("")
+        corpus = values if corpus is None else corpus + " " + values
 
     try:
         vectorizer = TfidfVectorizer(
@@ -570,27 +794,81 @@ def generate_candidate_pairs(
         )
         matrix = vectorizer.fit_transform(corpus)
 
-        k = min(n_neighbors, size)
-        nn = NearestNeighbors(metric="cosine", algorithm="brute")
-        nn.fit(matrix)
-        distances, indices = nn.kneighbors(matrix, n_neighbors=k)
-
-        pairs: set[tuple[int, int]] = set()
-        for i, neighbors in enumerate(indices):
-            for j in neighbors[1:]:  # Skip self
-                if i < j:
-                    pairs.add((i, j))
-                elif j < i:
-                    pairs.add((j, i))
-        return pairs
+        transposed = matrix.T.tocsc()
+
+        # A record's row in the product has at most as many entries as the
+        # document frequencies of its terms add up to; blocks are cut so
+        # that these bounds stay within CANDIDATE_BLOCK_NONZEROS
+        document_frequency = np.bincount(matrix.indices, minlength=matrix.shape[1])
+        row_bounds = np.add.reduceat(
+            np.append(document_frequency[matrix.indices], 0),
+            np.minimum(matrix.indptr[:-1], matrix.nnz),
+        )
+        row_bounds[np.diff(matrix.indptr) == 0] = 0
+        cumulative_bounds = np.cumsum(row_bounds)
+
+        pair_keys = []
+        start = 0
+        while start < size:
+            budget = CANDIDATE_BLOCK_NONZEROS + (cumulative_bounds[start - 1] if start else 0)
+            stop = max(
+                int(np.searchsorted(cumulative_bounds, budget, side='right')), start + 1
+            )
+            similarity = (matrix[start:stop] @ transposed).tocsr()
+            row_counts = np.diff(similarity.indptr)
+            rows = np.repeat(np.arange(len(row_counts)), row_counts)
+            neighbors = similarity.indices
+            scores = similarity.data
+
+            # Nearest neighbours (including the record itself) plus every
+            # record within the similarity radius
+            close = (scores >= min_similarity) | (row_counts[rows] <= n_neighbors)
+            for row in np.flatnonzero(row_counts > n_neighbors).tolist():
+                row_start, row_stop = similarity.indptr[row], similarity.indptr[row + 1]
+                nearest = np.argpartition(-scores[row_start:row_stop], n_neighbors - 1)
+                close[row_start + nearest[:n_neighbors]] = True
+
+            i = rows[close] + start
+            j = neighbors[close]
+            different = i != j
+            i, j = i[different], j[different]
+
+            # Records with fewer than n_neighbors - 1 similar records, in
+            # particular those without any term, are filled up with records
+            # of similarity 0 in positional order, as the k-NN search did
+            similar_counts = np.bincount(i - start, minlength=stop - start)
+            padding_left = []
+            padding_right = []
+            for row in np.flatnonzero(similar_counts < n_neighbors - 1).tolist():
+                record = start + row
+                taken = set(neighbors[similarity.indptr[row]:similarity.indptr[row + 1]].tolist())
+                taken.add(record)
+                missing = n_neighbors - 1 - int(similar_counts[row])
+                for other in range(size):
+                    if missing == 0:
+                        break
+                    if other not in taken:
+                        padding_left.append(record)
+                        padding_right.append(other)
+                        missing -= 1
+            i = np.concatenate((i, np.asarray(padding_left, dtype=i.dtype)))
+            j = np.concatenate((j, np.asarray(padding_right, dtype=j.dtype)))
+            pair_keys.append(np.minimum(i, j).astype(np.int64) * size + np.maximum(i, j))
+            start = stop
+
+        pair_keys = np.unique(np.concatenate(pair_keys))
+        return np.column_stack(np.divmod(pair_keys, size)).astype(np.intp)
     except ValueError as e:
         if "empty vocabulary" in str(e) or "After pruning, no terms remain" in str(e):
             # Fallback: if TF-IDF fails (e.g., empty vocabulary), compare all pairs
-            return {(i, j) for i in range(size) for j in range(i + 1, size)}
+            return _all_pairs(size)
+        raise
+    except MemoryError:
+        # A full comparison would need even more memory
         raise
     except Exception:
-        # On unexpected errors (e.g., MemoryError), fall back to full comparison
-        return {(i, j) for i in range(size) for j in range(i + 1, size)}
+        # On other unexpected errors, fall back to full comparison
+        return _all_pairs(size)
 
 
 def find_fuzzy_duplicates(
@@ -624,87 +902,126 @@ def find_fuzzy_duplicates(
     
     # Stage 1: Group by exact match fields
     if exact_fields:
+        # Grouping on the key columns themselves hashes per column instead of
+        # building one joined string per row
         exact_key_cols = list(exact_fields)
-        grouping_keys = dataframe[exact_key_cols].fillna("").astype(str).agg("_".join, axis=1)
-        groups = dataframe.groupby(grouping_keys).indices
+        grouping_keys = dataframe[exact_key_cols].fillna("").astype(str)
+        groups = grouping_keys.groupby(exact_key_cols, sort=False).indices
     else:
         groups = {"all": dataframe.index.tolist()}
     
     total_comparisons = sum(len(group_indices) for group_indices in groups.values())
     processed = 0
     
-    # Helper function to check salary compatibility
-    def are_salaries_compatible(sal1, sal2):
-        if pd.isna(sal1) or pd.isna(sal2):
-            return True
-        
-        s1, s2 = str(sal1).upper(), str(sal2).upper()
-        
-        # Extract numeric grade from salary strings
-        def extract_grade(salary_str: str) -> tuple[Optional[int], Optional[str]]:
-            # Look for patterns like E9, EG9, E 9, EG 9B, etc.
-            match = re.search(r'E\s*G?\s*(\d+)\s*([A-Z]*)', salary_str)
-            if match:
-                return int(match.group(1)), match.group(2)
-            return None, None
-        
-        grade1, suffix1 = extract_grade(s1)
-        grade2, suffix2 = extract_grade(s2)
-        
-        if grade1 is not None and grade2 is not None:
-            # Grades must be identical or differ by max 1 level
-            if abs(grade1 - grade2) > 1:
-                return False
-            # If same grade, suffixes should be similar
-            if grade1 == grade2 and suffix1 != suffix2:
-                # Allow some flexibility (e.g., E9 vs E9B)
-                if suffix1 and suffix2:
-                    if suffix1 not in suffix2 and suffix2 not in suffix1:
-                        return False
-                # At least one suffix is empty, allow compatibility
-        
-        return True
-    
-    # Helper function to check company compatibility
-    def are_companies_compatible(comp1, comp2):
-        if pd.isna(comp1) or pd.isna(comp2):
-            return True
-        
-        c1, c2 = str(comp1).lower(), str(comp2).lower()
-        
-        # Remove common words that might vary
-        stop_words = ['gmbh', 'ag', 'ev', 'e.v.', 'bibliothek', 'stadtbibliothek', 
-                     'universitätsbibliothek', 'landesbibliothek', 'stadt', 'universität']
-        
-        for word in stop_words:
-            c1 = c1.replace(word, '')
-            c2 = c2.replace(word, '')
-        
-        # Clean whitespace
-        c1 = ' '.join(c1.split())
-        c2 = ' '.join(c2.split())
-        
-        # Must have significant overlap
-        if len(c1) > 10 and len(c2) > 10:
-            score = int(fuzz.token_sort_ratio(c1, c2))
-            return score >= 85
-        
-        return True
-    
-    # Helper function to check location compatibility  
-    def are_locations_compatible(loc1, loc2):
-        if pd.isna(loc1) or pd.isna(loc2):
-            return True
-        
-        l1, l2 = str(loc1).lower().strip(), str(loc2).lower().strip()
-        
-        # Exact match or very high similarity required
-        if l1 == l2:
-            return True
-        
-        score = int(fuzz.ratio(l1, l2))
-        return score >= 90
+    # Pay grade (NaN if there is none) and its suffix of a salary
+    def salary_grade(salary: Any) -> tuple[float, str]:
+        match = _SALARY_GRADE_RE.search(str(salary).upper())
+        if match:
+            return float(match.group(1)), match.group(2)
+        return np.nan, ""
     
+    # Company names without the common words that might vary
+    def company_key(company: Any) -> str:
+        key = str(company).lower()
+        for word in ['gmbh', 'ag', 'ev', 'e.v.', 'bibliothek', 'stadtbibliothek',
+                     'universitätsbibliothek', 'landesbibliothek', 'stadt', 'universität']:
+            key = key.replace(word, '')
+        return ' '.join(key.split())
+
+    # Apply *prepare* once per distinct value of *series*; missing values
+    # become ""
+    def prepare_values(series: pd.Series, prepare: Callable[[Any], str]) -> np.ndarray:
+        codes, uniques = pd.factorize(series)
+        return np.array([prepare(value) for value in uniques] + [""], dtype=object)[codes]
+
+    # Token-sorted text of the fuzzy fields and the lower-cased job
+    # description, prepared once per row. Candidate pairs are scored in one
+    # RapidFuzz batch per group.
+    fuzzy_texts = {
+        col: _sort_tokens(dataframe[col].fillna("").astype(str))
+        for col in fuzzy_fields
+    }
+    descriptions = None
+    if 'jobdescription' in dataframe.columns:
+        lowered_descriptions = (
+            dataframe['jobdescription'].fillna("").astype(str).str.lower()
+        )
+        description_lengths = lowered_descriptions.str.len().to_numpy()
+        lowered_descriptions = lowered_descriptions.to_numpy()
+        descriptions = _sort_tokens(lowered_descriptions)
+
+    # Missing masks, numbers, non-null counts and prepared comparison keys as
+    # NumPy arrays so the pair checks avoid building a pandas row for every
+    # candidate pair.
+    missing = {col: dataframe[col].isna().to_numpy() for col in fuzzy_fields | numeric_fields}
+    numeric_values = {
+        col: pd.to_numeric(dataframe[col], errors='coerce').to_numpy(dtype=np.float64)
+        for col in numeric_fields
+    }
+    nonnull_counts = dataframe.notna().sum(axis=1).to_numpy()
+    company_keys = location_keys = salary_grades = None
+    if 'salary' in dataframe.columns:
+        salary_codes, salaries = pd.factorize(dataframe['salary'])
+        grades, suffixes = zip(*[salary_grade(salary) for salary in salaries], (np.nan, ""))
+        salary_grades = np.array(grades, dtype=np.float64)[salary_codes]
+        salary_suffixes = np.array(suffixes, dtype=object)[salary_codes]
+    if 'company' in dataframe.columns:
+        # Token-sorted for ``fuzz.ratio``; sorting keeps the length
+        company_keys = _sort_tokens(prepare_values(dataframe['company'], company_key))
+        company_lengths = np.fromiter(map(len, company_keys), dtype=np.intp, count=len(company_keys))
+    if 'location' in dataframe.columns:
+        location_keys = prepare_values(
+            dataframe['location'], lambda location: str(location).lower().strip()
+        )
+        missing_locations = dataframe['location'].isna().to_numpy()
+    accepted_left: list[np.ndarray] = []
+    accepted_right: list[np.ndarray] = []
+    accepted_probabilities: list[np.ndarray] = []
+
+    # Look for contradictory terms
+    contradictory_pairs = [
+        ('vollzeit', 'teilzeit'),
+        ('befristet', 'unbefristet'),
+        ('ausbildung', 'arbeitsstelle'),
+        ('leitung', 'mitarbeiter'),
+        ('e13', 'e9'), ('e12', 'e8'), ('e11', 'e7'),
+        ('e10', 'e6'), ('e9', 'e5'),  # Different pay grades
+    ]
+    # Which rows mention which term, looked up once per row instead of per pair
+    term_present = {}
+    if descriptions is not None:
+        description_series = pd.Series(lowered_descriptions, dtype=object)
+        term_present = {
+            term: description_series.str.contains(term, regex=False).to_numpy(dtype=bool)
+            for term in dict.fromkeys(term for pair in contradictory_pairs for term in pair)
+        }
+
+    def score_pairs(
+        texts: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        active: np.ndarray,
+        score_cutoff: float,
+    ) -> np.ndarray:
+        # Only the *active* pairs are scored; scores below *score_cutoff* and
+        # inactive pairs are 0. ``fuzz.ratio`` on token-sorted text equals
+        # ``fuzz.token_sort_ratio``.
+        scores = np.zeros(len(left), dtype=np.float64)
+        if active.any():
+            scores[active] = process.cpdist(
+                texts[left[active]],
+                texts[right[active]],
+                scorer=fuzz.ratio,
+                score_cutoff=score_cutoff,
+                dtype=np.float64,
+                workers=-1,
+            )
+        return scores
+
+    # Text of the fuzzy fields for candidate generation, converted once so
+    # each group only slices the rows it needs
+    candidate_text = dataframe[list(fuzzy_fields)].fillna("")
+
     # Stage 2: Within each group, generate candidate pairs and apply very strict fuzzy matching
     for group_indices in groups.values():
         group_size = len(group_indices)
@@ -714,179 +1031,171 @@ def find_fuzzy_duplicates(
                 progress_callback((processed / total_comparisons) * 100)
             continue
 
-        group_df = dataframe.iloc[group_indices]
-        candidate_pairs = generate_candidate_pairs(group_df, fuzzy_fields)
-
-        for i, j in candidate_pairs:
-            global_i = group_indices[i]
-            global_j = group_indices[j]
-
-            if global_i in drop_indices or global_j in drop_indices:
-                continue
-
-            row_i = dataframe.iloc[global_i]
-            row_j = dataframe.iloc[global_j]
-
-            # Pre-checks: These must pass for any potential duplicate
-
-            # 1. Salary compatibility check
-            if 'salary' in dataframe.columns:
-                if not are_salaries_compatible(row_i.get('salary'), row_j.get('salary')):
-                    continue
-
-            # 2. Company compatibility check
-            if 'company' in dataframe.columns:
-                if not are_companies_compatible(row_i.get('company'), row_j.get('company')):
-                    continue
-
-            # 3. Location compatibility check
-            if 'location' in dataframe.columns:
-                if not are_locations_compatible(row_i.get('location'), row_j.get('location')):
-                    continue
-
-            # 4. Job description must be VERY similar (95%+)
-            if 'jobdescription' in dataframe.columns:
-                desc1 = str(row_i.get('jobdescription', '')).lower()
-                desc2 = str(row_j.get('jobdescription', '')).lower()
-                if len(desc1) > 10 and len(desc2) > 10:
-                    desc_score = int(fuzz.token_sort_ratio(desc1, desc2))
-                    if desc_score < 95:
-                        continue
-
-            # Now apply fuzzy matching with very high standards
-            scores: list[float] = []
-            match = True
-
-            # Check fuzzy fields with very high standards
-            for col in fuzzy_fields:
-                if col not in dataframe.columns:
-                    continue
-                val_i = row_i.get(col)
-                val_j = row_j.get(col)
-
-                if pd.isna(val_i) and pd.isna(val_j):
-                    continue
-                if pd.isna(val_i) or pd.isna(val_j):
-                    match = False
-                    break
-
-                score = int(fuzz.token_sort_ratio(str(val_i), str(val_j)))
-
-                # Very high threshold for each field
-                min_score = 95 if col == 'jobdescription' else 90
-                if score < min_score:
-                    match = False
-                    break
-                scores.append(score)
-
-            if not match:
-                continue
-
-            # Check numeric fields (geo coordinates) with tighter tolerance
-            for col in numeric_fields:
-                if col not in dataframe.columns:
-                    continue
-                val_i = row_i.get(col)
-                val_j = row_j.get(col)
-
-                if pd.isna(val_i) and pd.isna(val_j):
-                    continue
-                if pd.isna(val_i) or pd.isna(val_j):
-                    match = False
-                    break
-
-                try:
-                    diff = abs(float(val_i) - float(val_j))
-                except (ValueError, TypeError):
-                    match = False
-                    break
-
-                # Very strict geographic tolerance: 0.01 degrees (~1km)
-                max_diff = 0.01
-                score = max(0.0, 100 * (1 - min(diff / max_diff, 1)))
-                if score < 95:
-                    match = False
-                    break
-                scores.append(score)
-
-            if not match:
-                continue
-
-            # Additional final checks
-            # Check if job descriptions have substantially different key terms
-            if 'jobdescription' in dataframe.columns:
-                desc1 = str(row_i.get('jobdescription', '')).lower()
-                desc2 = str(row_j.get('jobdescription', '')).lower()
-
-                # Look for contradictory terms
-                contradictory_pairs = [
-                    ('vollzeit', 'teilzeit'),
-                    ('befristet', 'unbefristet'),
-                    ('ausbildung', 'arbeitsstelle'),
-                    ('leitung', 'mitarbeiter'),
-                    ('e13', 'e9'), ('e12', 'e8'), ('e11', 'e7'),
-                    ('e10', 'e6'), ('e9', 'e5'),  # Different pay grades
-                ]
-
-                for term1, term2 in contradictory_pairs:
-                    if (term1 in desc1 and term2 in desc2) or (term2 in desc1 and term1 in desc2):
-                        match = False
-                        break
-
-            if not match:
-                continue
-
-            # Calculate final probability - must be very high
-            if scores:
-                avg_score = sum(scores) / len(scores)
-                probability = int(avg_score)
-            else:
-                probability = 95
-
-            # Only accept near-perfect matches
-            if probability < 95:
-                continue
-
-            # Determine which record to keep
-            nonnull_i = row_i.count()
-            nonnull_j = row_j.count()
+        pair_array = generate_candidate_pairs(candidate_text.iloc[group_indices], fuzzy_fields)
+        group_positions = np.asarray(group_indices)
+        left = group_positions[pair_array[:, 0]]
+        right = group_positions[pair_array[:, 1]]
+
+        # The checks below do not depend on each other, so the cheap numeric
+        # ones are evaluated for all pairs at once and the string based ones
+        # only for the pairs that are still accepted.
+        accepted = np.ones(len(pair_array), dtype=bool)
+        score_sum = np.zeros(len(pair_array), dtype=np.float64)
+        score_count = np.zeros(len(pair_array), dtype=np.intp)
+
+        # Job description must be VERY similar (95%+)
+        if descriptions is not None and len(pair_array):
+            long_descriptions = (description_lengths[left] > 10) & (description_lengths[right] > 10)
+            desc_scores = score_pairs(descriptions, left, right, long_descriptions, 95)
+            accepted &= ~long_descriptions | (desc_scores >= 95)
+
+        # Check fuzzy fields with very high standards
+        for col, texts in fuzzy_texts.items():
+            if not accepted.any():
+                break
+            missing_i, missing_j = missing[col][left], missing[col][right]
+            compared = ~missing_i & ~missing_j
+            accepted &= compared | (missing_i & missing_j)
+
+            # Very high threshold for each field. Pairs that are already
+            # rejected are not scored, their probability is never used.
+            min_score = 95 if col == 'jobdescription' else 90
+            score = np.trunc(score_pairs(texts, left, right, accepted & compared, min_score))
+            accepted &= ~compared | (score >= min_score)
+            score_sum += np.where(compared, score, 0.0)
+            score_count += compared
+
+        # Check numeric fields (geo coordinates) with tighter tolerance
+        for col in numeric_fields:
+            missing_i, missing_j = missing[col][left], missing[col][right]
+            values_i, values_j = numeric_values[col][left], numeric_values[col][right]
+            compared = ~missing_i & ~missing_j
+            accepted &= compared | (missing_i & missing_j)
+            # Values that cannot be converted to float never match
+            accepted &= ~compared | (~np.isnan(values_i) & ~np.isnan(values_j))
+
+            # Very strict geographic tolerance: 0.01 degrees (~1km)
+            max_diff = 0.01
+            with np.errstate(invalid='ignore'):
+                diff = np.abs(values_i - values_j)
+                score = np.maximum(0.0, 100 * (1 - np.minimum(diff / max_diff, 1)))
+                accepted &= ~compared | (score >= 95)
+            score_sum += np.where(compared, score, 0.0)
+            score_count += compared
+
+        # Calculate final probability - must be very high
+        with np.errstate(invalid='ignore', divide='ignore'):
+            probabilities = np.where(
+                score_count > 0, np.trunc(score_sum / score_count), 95
+            ).astype(np.intp)
+        # Only accept near-perfect matches
+        accepted &= probabilities >= 95
+
+        # Job descriptions must not have substantially different key terms
+        for term1, term2 in contradictory_pairs:
+            if not term_present:
+                break
+            present1, present2 = term_present[term1], term_present[term2]
+            accepted &= ~(
+                (present1[left] & present2[right]) | (present2[left] & present1[right])
+            )
 
-            if nonnull_i >= nonnull_j:
-                keep_idx, drop_idx = global_i, global_j
-            else:
-                keep_idx, drop_idx = global_j, global_i
+        # Company names must have significant overlap
+        if company_keys is not None:
+            long_names = (company_lengths[left] > 10) & (company_lengths[right] > 10)
+            score = score_pairs(company_keys, left, right, accepted & long_names, 85)
+            accepted &= ~long_names | (score >= 85)
+
+        # Locations must match exactly or be very similar
+        if location_keys is not None:
+            compared = ~missing_locations[left] & ~missing_locations[right]
+            same = location_keys[left] == location_keys[right]
+            score = score_pairs(location_keys, left, right, accepted & compared & ~same, 90)
+            accepted &= ~compared | same | (score >= 90)
+
+        # Pay grades must be identical or differ by max 1 level; the same
+        # grade needs similar suffixes (e.g. E9 vs E9B is fine)
+        if salary_grades is not None:
+            grade_i, grade_j = salary_grades[left], salary_grades[right]
+            accepted &= ~(np.abs(grade_i - grade_j) > 1)
+            for pair_idx in np.flatnonzero(accepted & (grade_i == grade_j)).tolist():
+                suffix1 = salary_suffixes[left[pair_idx]]
+                suffix2 = salary_suffixes[right[pair_idx]]
+                if suffix1 and suffix2 and suffix1 not in suffix2 and suffix2 not in suffix1:
+                    accepted[pair_idx] = False
+
+        accepted_left.append(left[accepted])
+        accepted_right.append(right[accepted])
+        accepted_probabilities.append(probabilities[accepted])
 
-            drop_indices.add(drop_idx)
-            pairs.setdefault(keep_idx, []).append((drop_idx, probability))
-        
         processed += len(group_indices)
         if progress_callback:
             progress_callback((processed / total_comparisons) * 100)
     
+    # Stage 3: Records linked by accepted pairs form one duplicate cluster. Of
+    # each cluster the record with the most non-null values is kept (the
+    # first one on ties); every other record is dropped with the probability
+    # of its best accepted pair.
+    if accepted_left:
+        edge_left = np.concatenate(accepted_left)
+        edge_right = np.concatenate(accepted_right)
+        edge_probabilities = np.concatenate(accepted_probabilities)
+    else:
+        edge_left = edge_right = edge_probabilities = np.empty(0, dtype=np.intp)
+
+    if len(edge_left):
+        size = len(dataframe)
+        graph = csr_matrix(
+            (np.ones(len(edge_left), dtype=np.int8), (edge_left, edge_right)),
+            shape=(size, size),
+        )
+        _, labels = connected_components(graph, directed=False)
+        best_probability = np.zeros(size, dtype=np.intp)
+        np.maximum.at(best_probability, edge_left, edge_probabilities)
+        np.maximum.at(best_probability, edge_right, edge_probabilities)
+
+        linked = np.unique(np.concatenate((edge_left, edge_right)))
+        linked = linked[np.argsort(labels[linked], kind='stable')]
+        boundaries = np.flatnonzero(np.diff(labels[linked])) + 1
+        for members in np.split(linked, boundaries):
+            keep_idx = int(members[np.argmax(nonnull_counts[members])])
+            for drop_idx in members.tolist():
+                if drop_idx == keep_idx:
+                    continue
+                drop_indices.add(drop_idx)
+                pairs.setdefault(keep_idx, []).append(
+                    (drop_idx, int(best_probability[drop_idx]))
+                )
+
     if progress_callback:
         progress_callback(100)
     
-    # Build result DataFrames
-    duplicate_rows = []
+    # Build result DataFrames: every cluster's kept row followed by its
+    # dropped rows, taken from *dataframe* in one go
+    result_rows: list[int] = []
+    keep_flags: list[bool] = []
+    pair_ids: list[int] = []
+    probabilities: list[int] = []
     for pair_id, (keep_idx, drop_pairs) in enumerate(pairs.items()):
-        keep_row = dataframe.iloc[keep_idx].copy()
-        keep_row["keep"] = True
-        keep_row["pair_id"] = pair_id
-        keep_row["orig_index"] = keep_idx
         keep_scores = [score for _, score in drop_pairs]
-        keep_row["probability"] = max(keep_scores) if keep_scores else 100
-        duplicate_rows.append(keep_row)
-        
+        result_rows.append(keep_idx)
+        keep_flags.append(True)
+        pair_ids.append(pair_id)
+        probabilities.append(max(keep_scores) if keep_scores else 100)
+
         for drop_idx, score in drop_pairs:
-            drop_row = dataframe.iloc[drop_idx].copy()
-            drop_row["keep"] = False
-            drop_row["pair_id"] = pair_id
-            drop_row["orig_index"] = drop_idx
-            drop_row["probability"] = score
-            duplicate_rows.append(drop_row)
-    
-    duplicates = pd.DataFrame(duplicate_rows)
-    if not duplicates.empty:
+            result_rows.append(drop_idx)
+            keep_flags.append(False)
+            pair_ids.append(pair_id)
+            probabilities.append(score)
+
+    duplicates = pd.DataFrame()
+    if result_rows:
+        duplicates = dataframe.iloc[result_rows].reset_index(drop=True)
+        duplicates["keep"] = keep_flags
+        duplicates["pair_id"] = pair_ids
+        duplicates["orig_index"] = result_rows
+        duplicates["probability"] = probabilities
         duplicates = duplicates.sort_values(
             ["probability", "pair_id", "keep"], ascending=[False, True, False]
         )
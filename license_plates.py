@@ -1,18 +1,32 @@
 """Helper functions for working with German license plate codes."""
+import functools
 import json
 import os
+import pickle
 import re
 import time
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 import pandas as pd
 import requests
 
 from utils import make_status_printer
 
+# Distinguishing sign of a German license plate (1-3 capital letters)
+_PLATE_CODE_RE = re.compile(r"^[A-Z]{1,3}$")
+
 
 def get_cache_file_path() -> str:
     """Return the path for the license plate cache file."""
+    return os.path.join(
+        os.path.dirname(__file__),
+        "cache",
+        "license_plate_cache.pkl",
+    )
+
+
+def get_json_cache_file_path() -> str:
+    """Return the path for the human-readable license plate cache file."""
     return os.path.join(
         os.path.dirname(__file__),
         "cache",
@@ -20,18 +34,57 @@ def get_cache_file_path() -> str:
     )
 
 
+@functools.lru_cache(maxsize=2)
+def _read_cache_file(path: str, stamp: Tuple[int, int]) -> Dict[str, str]:
+    """Parse the cache file at *path* with upper-cased codes.
+
+    *stamp* holds the file's modification time and size, so the memoized
+    mapping is reused until the file changes on disk.
+    """
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as handle:
+            license_plate_map = json.load(handle)
+    else:
+        with open(path, "rb") as handle:
+            license_plate_map = pickle.load(handle)
+    # Codes are looked up upper-cased, so the keys have to be upper case too
+    return {code.upper(): place for code, place in license_plate_map.items()}
+
+
+# Errors that mark a cache file as unreadable. Unpickling can fail with
+# almost any exception when the file is corrupt or was written by other code.
+_CACHE_READ_ERRORS = (
+    pickle.UnpicklingError,
+    EOFError,
+    OSError,
+    ValueError,  # includes json.JSONDecodeError
+    AttributeError,
+    ImportError,
+    TypeError,
+)
+
+
 def load_license_plate_cache(
     status_callback: Optional[Callable[[str], None]] = None,
 ) -> Dict[str, str]:
-    """Load license plate mapping from local cache file."""
+    """Load license plate mapping from local cache file.
+
+    The binary cache is preferred; the JSON file shipped with the repository
+    is used when no binary cache has been written yet or it cannot be read.
+    """
     _status = make_status_printer(status_callback)
-    cache_file = get_cache_file_path()
-    try:
-        if os.path.exists(cache_file):
-            with open(cache_file, "r", encoding="utf-8") as handle:
-                return json.load(handle)
-    except (json.JSONDecodeError, IOError) as exc:  # pragma: no cover - log path
-        _status(f"Warnung: Kennzeichen-Cache konnte nicht geladen werden: {exc}")
+    for path in (get_cache_file_path(), get_json_cache_file_path()):
+        if not os.path.exists(path):
+            continue
+        try:
+            info = os.stat(path)
+            # Copy so callers cannot alter the memoized mapping
+            return dict(_read_cache_file(path, (info.st_mtime_ns, info.st_size)))
+        except _CACHE_READ_ERRORS as exc:
+            _status(
+                f"Warnung: Kennzeichen-Cache {os.path.basename(path)} "
+                f"konnte nicht geladen werden: {exc}"
+            )
     return {}
 
 
@@ -42,11 +95,36 @@ def save_license_plate_cache(
     """Save license plate mapping to local cache file."""
     _status = make_status_printer(status_callback)
     cache_file = get_cache_file_path()
+    temp_file = cache_file + ".tmp"
     try:
-        with open(cache_file, "w", encoding="utf-8") as handle:
-            json.dump(license_plate_map, handle, ensure_ascii=False, indent=2)
-    except IOError as exc:  # pragma: no cover - log path
+        # Write next to the cache and swap it in, so an interrupted write
+        # never leaves a truncated cache behind
+        with open(temp_file, "wb") as handle:
+            pickle.dump(license_plate_map, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as exc:
         _status(f"Warnung: Kennzeichen-Cache konnte nicht gespeichert werden: {exc}")
+    finally:
+        # Only left over if writing or replacing failed
+        if os.path.exists(temp_file):
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+
+
+def export_license_plate_cache_json(
+    license_plate_map: Dict[str, str],
+    path: Optional[str] = None,
+) -> str:
+    """Write *license_plate_map* as indented JSON for inspection.
+
+    Returns the path of the written file, by default the JSON cache file.
+    """
+    path = path or get_json_cache_file_path()
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(license_plate_map, handle, ensure_ascii=False, indent=2)
+    return path
 
 
 def fetch_german_license_plates_from_api(
@@ -66,6 +144,7 @@ def fetch_german_license_plates_from_api(
     endpoint = "https://query.wikidata.org/sparql"
     headers = {
         "Accept": "application/sparql-results+json",
+        "Accept-Encoding": "gzip, deflate",
         "User-Agent": (
             "Bibliojobs-Data-Cleaning-Tool/1.0 "
             "(Educational Project; Contact: ehrmann@gfz.de)"
@@ -75,60 +154,66 @@ def fetch_german_license_plates_from_api(
     max_retries = 3
     base_delay = 2.0
 
-    for attempt in range(max_retries):
-        try:
-            if attempt > 0:
-                delay = base_delay * (2 ** (attempt - 1))
-                _status(
-                    "Wikidata-API wird in "
-                    f"{delay} Sekunden erneut aufgerufen... (Versuch {attempt + 1}/{max_retries})"
-                )
-                time.sleep(delay)
-
-            response = requests.get(
-                endpoint,
-                params={"query": sparql_query},
-                headers=headers,
-                timeout=45,
-            )
+    # One session for all attempts so retries reuse the TLS connection
+    with requests.Session() as session:
+        session.headers.update(headers)
 
-            if response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
-                if retry_after:
-                    wait_time = min(int(retry_after), 60)
+        for attempt in range(max_retries):
+            try:
+                if attempt > 0:
+                    delay = base_delay * (2 ** (attempt - 1))
                     _status(
-                        f"Von Wikidata ausgebremst. Warte {wait_time} Sekunden..."
+                        "Wikidata-API wird in "
+                        f"{delay} Sekunden erneut aufgerufen... (Versuch {attempt + 1}/{max_retries})"
                     )
-                    time.sleep(wait_time)
+                    time.sleep(delay)
+
+                # POST keeps the query out of the URL; the JSON result is
+                # transferred gzip-compressed. An unreachable host fails after
+                # the short connect timeout, the query itself may take longer
+                response = session.post(
+                    endpoint,
+                    data={"query": sparql_query},
+                    timeout=(10, 45),
+                )
+
+                if response.status_code == 429:
+                    retry_after = response.headers.get("Retry-After")
+                    if retry_after:
+                        wait_time = min(int(retry_after), 60)
+                        _status(
+                            f"Von Wikidata ausgebremst. Warte {wait_time} Sekunden..."
+                        )
+                        time.sleep(wait_time)
+                        continue
                     continue
-                continue
-
-            response.raise_for_status()
-            data = response.json()
-            license_plate_map: Dict[str, str] = {}
-            for binding in data.get("results", {}).get("bindings", []):
-                if "licencePlate" in binding and "itemLabel" in binding:
-                    plate_code = binding["licencePlate"]["value"]
-                    place_name = binding["itemLabel"]["value"]
-                    if re.match(r"^[A-Z]{1,3}$", plate_code):
-                        license_plate_map[plate_code] = place_name
 
-            _status(
-                f"Erfolgreich {len(license_plate_map)} Kennzeichen-Zuordnungen von Wikidata geladen"
-            )
-            return license_plate_map
-
-        except requests.exceptions.Timeout:
-            _status(f"Zeitüberschreitung bei Versuch {attempt + 1}/{max_retries}")
-            if attempt == max_retries - 1:
-                _status("Alle API-Versuche führten zu einer Zeitüberschreitung")
-        except requests.exceptions.RequestException as exc:
-            _status(f"API-Fehler bei Versuch {attempt + 1}/{max_retries}: {exc}")
-            if attempt == max_retries - 1:
-                _status("Alle API-Versuche sind fehlgeschlagen")
-        except (KeyError, ValueError) as exc:
-            _status(f"Fehler beim Verarbeiten der Daten: {exc}")
-            break
+                response.raise_for_status()
+                data = response.json()
+                license_plate_map: Dict[str, str] = {}
+                for binding in data.get("results", {}).get("bindings", []):
+                    if "licencePlate" in binding and "itemLabel" in binding:
+                        plate_code = binding["licencePlate"]["value"]
+                        place_name = binding["itemLabel"]["value"]
+                        if _PLATE_CODE_RE.match(plate_code):
+                            license_plate_map[plate_code] = place_name
+
+                _status(
+                    f"Erfolgreich {len(license_plate_map)} Kennzeichen-Zuordnungen von Wikidata geladen"
+                )
+                return license_plate_map
+
+            except requests.exceptions.Timeout:
+                _status(f"Zeitüberschreitung bei Versuch {attempt + 1}/{max_retries}")
+                if attempt == max_retries - 1:
+                    _status("Alle API-Versuche führten zu einer Zeitüberschreitung")
+            except requests.exceptions.RequestException as exc:
+                _status(f"API-Fehler bei Versuch {attempt + 1}/{max_retries}: {exc}")
+                if attempt == max_retries - 1:
+                    _status("Alle API-Versuche sind fehlgeschlagen")
+            except (KeyError, ValueError) as exc:
+                _status(f"Fehler beim Verarbeiten der Daten: {exc}")
+                break
 
     return {}
 
@@ -164,12 +249,13 @@ def resolve_license_plates_in_series(
     if not license_plate_map:
         return series
 
-    def replace_license_plates(value):
-        if pd.isna(value):
-            return value
-        value_str = str(value).strip()
-        if value_str.upper() in license_plate_map:
-            return license_plate_map[value_str.upper()]
-        return value
+    # Only whole values are codes; surrounding whitespace and case are ignored
+    codes = series.astype(str).where(series.notna()).str.strip().str.upper()
+    places = codes.map(license_plate_map)
+    hits = places.notna()
+    if not hits.any():
+        return series
 
-    return series.apply(replace_license_plates)
+    resolved = series.copy()
+    resolved[hits] = places[hits]
+    return resolved
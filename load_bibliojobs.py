@@ -1,4 +1,6 @@
 """Utilities to load and clean the Bibliojobs dataset."""
+import csv
+import io
 import logging
 import os
 from typing import Callable, Optional, Union
@@ -7,6 +9,11 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Field delimiter of the raw export and the single byte it is swapped for so
+# that pandas' C parser can be used
+_DELIMITER = "_§_"
+_UNIT_SEPARATOR = b"\x1f"
+
 def load_bibliojobs(
     path: Union[str, os.PathLike[str]] = "bibliojobs_raw.csv",
     *,
@@ -36,19 +43,34 @@ def load_bibliojobs(
     if not os.path.exists(path_str):
         raise FileNotFoundError(f"CSV-Datei nicht gefunden: {path_str}")
 
-    # Read with explicit UTF-8 encoding and the `_§_` delimiter. If a
-    # ``progress_callback`` is supplied the file is read in chunks so that the
-    # caller can be informed about the progress of the operation.
+    # Read with explicit UTF-8 encoding and the `_§_` delimiter. The C parser
+    # only accepts single-character separators, so the delimiter is replaced
+    # by the ASCII unit separator first; quotes carry no meaning in this
+    # format. Files that already contain that byte go through the slower
+    # Python parser instead.
+    with open(path_str, "rb") as handle:
+        raw = handle.read()
+    if _UNIT_SEPARATOR in raw:
+        read_options = {"sep": _DELIMITER, "engine": "python"}
+    else:
+        raw = raw.replace(_DELIMITER.encode("utf-8"), _UNIT_SEPARATOR)
+        read_options = {
+            "sep": _UNIT_SEPARATOR.decode("ascii"),
+            "engine": "c",
+            "quoting": csv.QUOTE_NONE,
+        }
+
+    # If a ``progress_callback`` is supplied the file is read in chunks so
+    # that the caller can be informed about the progress of the operation.
     if progress_callback:
-        with open(path_str, encoding="utf-8") as handle:
-            total_rows = sum(1 for _ in handle) - 1
+        # Count the lines in place; a last line without newline counts too
+        total_rows = raw.count(b"\n") + (not raw.endswith(b"\n")) - 1
 
         reader = pd.read_csv(
-            path_str,
-            sep="_§_",
-            engine="python",
+            io.BytesIO(raw),
             encoding="utf-8",
             chunksize=1000,
+            **read_options,
         )
         chunks = []
         rows_read = 0
@@ -61,7 +83,7 @@ def load_bibliojobs(
         progress_callback(100.0)
         df = pd.concat(chunks, ignore_index=True)
     else:
-        df = pd.read_csv(path_str, sep="_§_", engine="python", encoding="utf-8")
+        df = pd.read_csv(io.BytesIO(raw), encoding="utf-8", **read_options)
 
     # Remove leading/trailing underscores and asterisks, standardise column names.
     normalised = df.columns.str.strip("_*").str.lower()
@@ -9,22 +9,61 @@ import pandas as pd
 # Common placeholders that should be treated as data errors/missing markers.
 ERROR_VALUES = ["", "??", "na", "n/a", "null", None]
 
+# Addresses embedded in company names (contain numbers and commas)
+_EMBEDDED_VALUE_RE = re.compile(r'\d+.*,.*\d+')
+# HTML entities or characters repeated four or more times
+_SPELLING_ERROR_RE = re.compile(r'&#\d+;|&[a-zA-Z]+;|(.)\1{3,}')
+_NON_WORD_RE = re.compile(r'[^\w]')
+# Parts of company names, locations or URLs that do not belong in jobtype
+_MISPLACED_VALUE_RE = re.compile(r'gmbh|ag|bibliothek|universität|http|www')
+# Placeholder values that are not a country
+_WRONG_COUNTRY_VALUES = ['test', 'xxx', '123', 'unknown']
 
-def get_all_error_types(series: pd.Series, column_name: str) -> List[Tuple[str, float]]:
+
+def _column_stats(series: pd.Series) -> dict[str, Any]:
+    """Collect the statistics shared by the profiling helpers for *series*.
+
+    Everything is derived from a single ``value_counts`` call, so the column
+    is counted once however many checks use the numbers.
+    """
+    counts = series.value_counts(dropna=True)
+    return {
+        "value_counts": counts,
+        "missing": int(series.isna().sum()),
+        "unique": int((counts > 0).sum()),
+        "marker_counts": _marker_counts(counts),
+    }
+
+
+def get_all_error_types(
+    series: pd.Series,
+    column_name: str,
+    stats: dict[str, Any] | None = None,
+) -> List[Tuple[str, float]]:
     """Get all error types for a series according to Naumann/Leser taxonomy.
     
     Returns a list of (error_type, error_rate) tuples for all detected error types.
+    *stats* may pass in the column statistics if they are already known.
     """
     total_count = len(series)
     if total_count == 0:
         return [("Keine Daten", 0.0)]
     
     error_types = []
+    if stats is None:
+        stats = _column_stats(series)
+    value_counts = stats["value_counts"]
+    marker_counts = stats["marker_counts"]
+    # The value checks below share the non-null values and, for the text
+    # columns, their string form
+    non_null = series.dropna()
+    if column_name.lower() in ["country", "location", "company", "jobdescription", "jobtype"]:
+        non_null_text = non_null.astype(str)
     
     # Count different error types
-    missing_count = series.isna().sum()
-    empty_count = (series == "").sum()
-    error_markers_count = sum((series == val).sum() for val in ERROR_VALUES if val not in [None, ""])
+    missing_count = stats["missing"]
+    empty_count = marker_counts.get("", 0)
+    error_markers_count = sum(marker_counts.get(val, 0) for val in ERROR_VALUES if val not in [None, ""])
     
     # Fehlende Werte (including various representations)
     total_missing = missing_count + empty_count + error_markers_count
@@ -35,117 +74,95 @@ def get_all_error_types(series: pd.Series, column_name: str) -> List[Tuple[str,
     # Duplikate (only check for columns that should be unique)
     unique_columns = ["jobid", "url"]
     if column_name.lower() in unique_columns:
-        non_null_series = series.dropna()
-        if len(non_null_series) > 0:
-            duplicate_count = len(non_null_series) - non_null_series.nunique()
+        non_null_count = total_count - missing_count
+        if non_null_count > 0:
+            duplicate_count = non_null_count - stats["unique"]
             if duplicate_count > 0:
                 duplicate_rate = (duplicate_count / total_count) * 100
                 error_types.append(("Eindeutigkeitsverletzungen", duplicate_rate))
     
     # Unzulässige Werte (for specific columns)
     if column_name.lower() in ["geo_lat", "geo_lon"]:
-        numeric_series = pd.to_numeric(series, errors="coerce")
-        invalid_count = 0
-        if column_name.lower() == "geo_lat":
-            invalid_count = ((numeric_series < -90) | (numeric_series > 90)).sum()
-        else:  # geo_lon
-            invalid_count = ((numeric_series < -180) | (numeric_series > 180)).sum()
+        # The loader already reads coordinates as floats
+        if pd.api.types.is_numeric_dtype(series):
+            numeric_series = series
+        else:
+            numeric_series = pd.to_numeric(series, errors="coerce")
+        limit = 90 if column_name.lower() == "geo_lat" else 180  # geo_lon
+        invalid_count = ((numeric_series < -limit) | (numeric_series > limit)).sum()
         if invalid_count > 0:
             invalid_values_rate = (invalid_count / total_count) * 100
             error_types.append(("Unzulässige Werte", invalid_values_rate))
     elif column_name.lower() == "country":
         # Check for obviously invalid country values
-        non_null = series.dropna()
         if len(non_null) > 0:
-            invalid_count = sum(1 for val in non_null if len(str(val)) < 2 or len(str(val)) > 50)
+            lengths = non_null_text.str.len()
+            invalid_count = int(((lengths < 2) | (lengths > 50)).sum())
             if invalid_count > 0:
                 invalid_values_rate = (invalid_count / total_count) * 100
                 error_types.append(("Unzulässige Werte", invalid_values_rate))
     
     # Kryptische Werte (very short codes without clear meaning)
     if column_name.lower() in ["location"]:
-        non_null = series.dropna()
         if len(non_null) > 0:
             # Count very short values that might be cryptic codes
-            cryptic_count = sum(1 for val in non_null if len(str(val).strip()) <= 3 and str(val).strip().isalpha())
+            stripped = non_null_text.str.strip()
+            cryptic_count = int(((stripped.str.len() <= 3) & stripped.str.isalpha()).sum())
             if cryptic_count > 0:
                 cryptic_rate = (cryptic_count / total_count) * 100
                 error_types.append(("Kryptische Werte", cryptic_rate))
     
     # Eingebettete Werte (multiple information in one field)
     if column_name.lower() in ["company"]:
-        non_null = series.dropna()
         if len(non_null) > 0:
             # Look for addresses embedded in company names (contains numbers and commas)
-            embedded_count = sum(1 for val in non_null if re.search(r'\d+.*,.*\d+', str(val)))
+            embedded_count = int(non_null_text.str.contains(_EMBEDDED_VALUE_RE).sum())
             if embedded_count > 0:
                 embedded_rate = (embedded_count / total_count) * 100
                 error_types.append(("Eingebettete Werte", embedded_rate))
     
     # Schreibfehler (suspicious patterns)
     if column_name.lower() in ["company", "location", "jobdescription"]:
-        non_null = series.dropna()
         if len(non_null) > 0:
-            # Look for HTML entities, unusual characters, repeated characters
-            error_patterns = [
-                r'&#\d+;',  # HTML entities
-                r'&[a-zA-Z]+;',  # HTML entities
-                r'(.)\1{3,}',  # Repeated characters (4+ times)
-            ]
-            spelling_count = 0
-            for val in non_null:
-                val_str = str(val)
-                if any(re.search(pattern, val_str) for pattern in error_patterns):
-                    spelling_count += 1
+            # Look for HTML entities and repeated characters
+            # ``str.contains`` warns about the back-reference group, so search
+            # with the compiled pattern directly
+            spelling_count = int(non_null_text.map(_SPELLING_ERROR_RE.search).notna().sum())
             if spelling_count > 0:
                 spelling_error_rate = (spelling_count / total_count) * 100
                 error_types.append(("Schreibfehler", spelling_error_rate))
     
     # Widersprüchliche Werte (logical inconsistencies)
     if column_name.lower() == "date":
-        non_null = series.dropna()
         if len(non_null) > 0:
             # Check for future dates (assuming data is from 2014-2025)
-            from datetime import datetime
-            future_count = 0
-            for val in non_null:
-                try:
-                    if pd.isna(val):
-                        continue
-                    date_val = pd.to_datetime(val) if not isinstance(val, pd.Timestamp) else val
-                    if date_val.year > 2025 or date_val.year < 2000:
-                        future_count += 1
-                except:
-                    pass
+            if pd.api.types.is_datetime64_any_dtype(non_null):
+                dates = non_null
+            else:
+                # Parse each value on its own format; unparsable values are
+                # skipped. Values may carry different UTC offsets, which only
+                # parse into one datetime column when converted to UTC
+                dates = pd.to_datetime(non_null, errors="coerce", format="mixed", utc=True)
+            years = dates.dt.year
+            future_count = int(((years > 2025) | (years < 2000)).sum())
             if future_count > 0:
                 contradiction_rate = (future_count / total_count) * 100
                 error_types.append(("Widersprüchliche Werte", contradiction_rate))
     
     # Falsche Zuordnungen (values in wrong columns)
     if column_name.lower() == "jobtype":
-        non_null = series.dropna()
         if len(non_null) > 0:
-            # Check if values look like they belong to other columns
-            misplaced_count = 0
-            for val in non_null:
-                val_str = str(val).lower()
-                # Check if value looks like a company name, location, or URL
-                if any(indicator in val_str for indicator in ['gmbh', 'ag', 'bibliothek', 'universität', 'http', 'www']):
-                    misplaced_count += 1
+            # Check if values look like a company name, location, or URL
+            misplaced_count = int(non_null_text.str.lower().str.contains(_MISPLACED_VALUE_RE).sum())
             if misplaced_count > 0:
                 misplacement_rate = (misplaced_count / total_count) * 100
                 error_types.append(("Falsche Zuordnungen", misplacement_rate))
     
     # Falsche Werte (obviously incorrect information)
     if column_name.lower() in ["country"]:
-        non_null = series.dropna()
         if len(non_null) > 0:
             # Check for obviously wrong country values
-            wrong_count = 0
-            for val in non_null:
-                val_str = str(val).lower()
-                if val_str in ['test', 'xxx', '123', 'unknown']:
-                    wrong_count += 1
+            wrong_count = int(non_null_text.str.lower().isin(_WRONG_COUNTRY_VALUES).sum())
             if wrong_count > 0:
                 wrong_rate = (wrong_count / total_count) * 100
                 error_types.append(("Falsche Werte", wrong_rate))
@@ -153,19 +170,23 @@ def get_all_error_types(series: pd.Series, column_name: str) -> List[Tuple[str,
     # Datenkonflikte (conflicting versions of same information)
     # This would typically require cross-record analysis, but we can check for inconsistent formatting
     if column_name.lower() in ["location", "company"]:
-        non_null = series.dropna()
         if len(non_null) > 0:
             # Check for different formatting of same values (very basic check)
-            value_counts = series.value_counts()
+            normalized = [_NON_WORD_RE.sub('', str(val).lower()) for val in value_counts.index]
+            # The first two positions of each normalized value are enough to
+            # find the first other value that normalizes the same way
+            positions: dict[str, list[int]] = {}
+            for position, key in enumerate(normalized):
+                found = positions.setdefault(key, [])
+                if len(found) < 2:
+                    found.append(position)
             similar_values = 0
-            for val in value_counts.index[:10]:  # Check top 10 values
-                val_normalized = re.sub(r'[^\w]', '', str(val).lower())
-                for other_val in value_counts.index:
-                    if val != other_val:
-                        other_normalized = re.sub(r'[^\w]', '', str(other_val).lower())
-                        if val_normalized == other_normalized and len(val_normalized) > 3:
-                            similar_values += value_counts[other_val]
-                            break
+            for position, key in enumerate(normalized[:10]):  # Check top 10 values
+                if len(key) <= 3:
+                    continue
+                others = [other for other in positions[key] if other != position]
+                if others:
+                    similar_values += value_counts.iloc[others[0]]
             if similar_values > 0:
                 conflict_rate = (similar_values / total_count) * 100
                 error_types.append(("Datenkonflikte", conflict_rate))
@@ -179,39 +200,64 @@ def get_all_error_types(series: pd.Series, column_name: str) -> List[Tuple[str,
     return error_types
 
 
-def classify_error_type(series: pd.Series, column_name: str) -> tuple[str, float]:
+def classify_error_type(
+    series: pd.Series,
+    column_name: str,
+    stats: dict[str, Any] | None = None,
+) -> tuple[str, float]:
     """Classify the primary error type for a series according to Naumann/Leser taxonomy.
     
     Returns the error type and the error rate (0-100).
     """
-    all_errors = get_all_error_types(series, column_name)
+    all_errors = get_all_error_types(series, column_name, stats)
     if not all_errors:
         return "Keine signifikanten Fehler", 0.0
     return all_errors[0]  # Return the most significant error
 
 
-def top_error(series: pd.Series) -> tuple[Any, int]:
-    """Return the most frequent error marker and its count for *series*.
+def _marker_counts(counts: pd.Series) -> dict[str, int]:
+    """Return how often each string marker of ``ERROR_VALUES`` occurs.
 
-    Parameters
-    ----------
-    series:
-        The pandas ``Series`` to analyse.
+    *counts* are the ``value_counts`` of a column. Only text columns can hold
+    the markers, so other columns report none.
     """
+    index = counts.index
+    if not (
+        pd.api.types.is_object_dtype(index.dtype)
+        or pd.api.types.is_string_dtype(index.dtype)
+        or isinstance(index.dtype, pd.CategoricalDtype)
+    ):
+        return {}
+    markers = [value for value in ERROR_VALUES if value is not None]
+    found = counts[index.isin(markers)]
+    return {str(value): int(count) for value, count in found.items()}
+
+
+def _top_error(marker_counts: dict[str, int], missing: int) -> tuple[Any, int]:
+    """Pick the most frequent error marker; the first one wins on ties."""
     top: Any = None
     top_count = 0
     for value in ERROR_VALUES:
-        # ``==`` works for all markers except ``None`` which we handle via ``isna``.
-        if value is None:
-            count = series.isna().sum()
-        else:
-            count = (series == value).sum()
+        # ``None`` stands for missing values
+        count = missing if value is None else marker_counts.get(value, 0)
         if count > top_count:
             top = value
             top_count = int(count)
     return top, top_count
 
 
+def top_error(series: pd.Series) -> tuple[Any, int]:
+    """Return the most frequent error marker and its count for *series*.
+
+    Parameters
+    ----------
+    series:
+        The pandas ``Series`` to analyse.
+    """
+    stats = _column_stats(series)
+    return _top_error(stats["marker_counts"], stats["missing"])
+
+
 def profile_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """Compute simple profiling statistics for *df*.
 
@@ -238,10 +284,11 @@ def profile_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     rows: list[dict[str, Any]] = []
     for column in df.columns:
         series = df[column]
-        missing = int(series.isna().sum())
-        unique = int(series.nunique(dropna=True))
-        error_val, error_count = top_error(series)
-        counts = series.value_counts(dropna=True)
+        stats = _column_stats(series)
+        counts = stats["value_counts"]
+        missing = stats["missing"]
+        unique = stats["unique"]
+        error_val, error_count = _top_error(stats["marker_counts"], missing)
         if not counts.empty:
             top_value = counts.idxmax()
             top_value_count = int(counts.iloc[0])
@@ -256,7 +303,7 @@ def profile_dataframe(df: pd.DataFrame) -> pd.DataFrame:
             error_display = str(error_val)
 
         # Classify main error type according to Naumann/Leser
-        main_error_type, main_error_rate = classify_error_type(series, column)
+        main_error_type, main_error_rate = classify_error_type(series, column, stats)
 
         rows.append(
             {
@@ -1,5 +1,6 @@
 import pathlib
 import sys
+import pickle
 import pytest
 from unittest.mock import patch, Mock
 import requests
@@ -8,7 +9,14 @@ import pandas as pd
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
 
-from cleaning import clean_dataframe, fetch_german_license_plates, resolve_license_plates_in_series
+from cleaning import (
+    clean_company_field,
+    clean_dataframe,
+    extract_jobdescription_info,
+    extract_plz_from_company,
+    fetch_german_license_plates,
+    resolve_license_plates_in_series,
+)
 
 def test_clean_dataframe_html_unescape_and_strip():
     df = pd.DataFrame({
@@ -17,7 +25,50 @@ def test_clean_dataframe_html_unescape_and_strip():
     cleaned = clean_dataframe(df)
     assert cleaned["a"].iloc[0] == "AT&T"
     assert cleaned["a"].iloc[1] == "Bold"
-    assert pd.isna(cleaned["a"].iloc[2])
+    assert cleaned["a"].iloc[2] is None
+
+
+def test_extract_plz_from_company():
+    series = pd.Series([
+        "Stadtbibliothek, 12345 Musterstadt",
+        "Universität Potsdam, 14469",
+        "Landesbibliothek 01067 Dresden",
+        "Firma 12345",
+        None,
+    ])
+
+    companies, plz = extract_plz_from_company(series)
+
+    assert companies.tolist()[:4] == [
+        "Stadtbibliothek",
+        "Universität Potsdam",
+        "Landesbibliothek",
+        "Firma 12345",
+    ]
+    assert companies.iloc[4] is None
+    assert plz.tolist() == ["12345", "14469", "01067", None, None]
+
+
+def test_clean_company_field_standardizes_names():
+    series = pd.Series([
+        "Musterverein ev, Hamburg",
+        "Beispiel gmbh, Softwarehersteller für Bibliotheken",
+        "Hochschule Rhein-Waal, Hochschulbibliothek, Standort Kleve",
+        "Stadtarchiv Musterstadt, Bibliothek, Standort Nord",
+        "Stadtbibliothek., Hamburg",
+        None,
+    ])
+
+    cleaned = clean_company_field(series)
+
+    assert cleaned.tolist()[:5] == [
+        "Musterverein e.V.",
+        "Beispiel GmbH",
+        "Hochschule Rhein-Waal",
+        "Stadtarchiv Musterstadt, Bibliothek",
+        "Stadtbibliothek",
+    ]
+    assert pd.isna(cleaned.iloc[5])
 
 
 def test_fetch_german_license_plates_real_api():
@@ -46,6 +97,90 @@ def test_fetch_german_license_plates_real_api():
             assert isinstance(place_name, str)
             assert len(place_name) > 0
 
+def test_fetch_german_license_plates_from_api_posts_query():
+    """The SPARQL query is posted once and only valid plate codes are kept."""
+    from license_plates import fetch_german_license_plates_from_api
+
+    response = Mock(status_code=200)
+    response.json.return_value = {
+        "results": {
+            "bindings": [
+                {"licencePlate": {"value": "B"}, "itemLabel": {"value": "Berlin"}},
+                {"licencePlate": {"value": "MZ"}, "itemLabel": {"value": "Mainz"}},
+                {"licencePlate": {"value": "xx1"}, "itemLabel": {"value": "Invalid"}},
+            ]
+        }
+    }
+    with patch("license_plates.requests.Session") as mock_session:
+        session = mock_session.return_value.__enter__.return_value
+        session.post.return_value = response
+
+        result = fetch_german_license_plates_from_api()
+
+    assert result == {"B": "Berlin", "MZ": "Mainz"}
+    session.post.assert_called_once()
+    assert "query" in session.post.call_args.kwargs["data"]
+
+
+def test_license_plate_cache_round_trip(tmp_path):
+    """The binary cache takes precedence over the shipped JSON file."""
+    from license_plates import (
+        export_license_plate_cache_json,
+        load_license_plate_cache,
+        save_license_plate_cache,
+    )
+
+    pickle_file = tmp_path / "license_plate_cache.pkl"
+    json_file = tmp_path / "license_plate_cache.json"
+    with patch("license_plates.get_cache_file_path", return_value=str(pickle_file)), \
+            patch("license_plates.get_json_cache_file_path", return_value=str(json_file)):
+        export_license_plate_cache_json({"B": "Berlin", "hh": "Hamburg"})
+        assert load_license_plate_cache() == {"B": "Berlin", "HH": "Hamburg"}
+
+        save_license_plate_cache({"B": "Berlin", "MZ": "Mainz"})
+        assert pickle_file.exists()
+        assert not (tmp_path / "license_plate_cache.pkl.tmp").exists()
+        cached = load_license_plate_cache()
+        assert cached == {"B": "Berlin", "MZ": "Mainz"}
+
+        # Callers get their own copy of the memoized mapping
+        cached["X"] = "Changed"
+        assert load_license_plate_cache() == {"B": "Berlin", "MZ": "Mainz"}
+
+
+def test_license_plate_cache_falls_back_to_json(tmp_path):
+    """An unreadable binary cache falls back to the shipped JSON file."""
+    from license_plates import export_license_plate_cache_json, load_license_plate_cache
+
+    pickle_file = tmp_path / "license_plate_cache.pkl"
+    json_file = tmp_path / "license_plate_cache.json"
+    messages = []
+    with patch("license_plates.get_cache_file_path", return_value=str(pickle_file)), \
+            patch("license_plates.get_json_cache_file_path", return_value=str(json_file)):
+        export_license_plate_cache_json({"B": "Berlin"})
+
+        pickle_file.write_bytes(b"not a pickle")
+        assert load_license_plate_cache(messages.append) == {"B": "Berlin"}
+
+        # Keys that are not strings make the binary cache unusable as well
+        pickle_file.write_bytes(pickle.dumps({1: "Eins"}))
+        assert load_license_plate_cache(messages.append) == {"B": "Berlin"}
+    assert len(messages) == 2
+
+
+def test_save_license_plate_cache_cleans_up_after_failure(tmp_path):
+    from license_plates import save_license_plate_cache
+
+    pickle_file = tmp_path / "license_plate_cache.pkl"
+    messages = []
+    with patch("license_plates.get_cache_file_path", return_value=str(pickle_file)):
+        # Local functions cannot be pickled
+        save_license_plate_cache({"B": lambda: "Berlin"}, messages.append)
+
+    assert messages
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_resolve_license_plates_in_series():
     """Test license plate resolution in pandas series."""
     license_plate_map = {
@@ -176,6 +311,7 @@ def test_clean_dataframe_with_location_column():
         assert cleaned["location"].iloc[0] == "Berlin"
         assert cleaned["location"].iloc[1] == "Mainz" 
         assert cleaned["location"].iloc[2] == "Frankfurt"
+        assert cleaned["location"].dtype == object
         
         # HTML should still be cleaned
         assert cleaned["other"].iloc[0] == "Test"
@@ -199,6 +335,23 @@ def test_clean_dataframe_without_location_column():
         assert cleaned["other"].iloc[2] == "AT&T"
 
 
+def test_clean_dataframe_leaves_input_untouched():
+    df = pd.DataFrame(
+        {
+            "company": ["<b>Stadtbibliothek</b>, 12345 Berlin"],
+            "other": ["AT&amp;T"],
+            "count": [1],
+        }
+    )
+    original = df.copy()
+
+    cleaned = clean_dataframe(df)
+
+    pd.testing.assert_frame_equal(df, original)
+    assert cleaned["other"].iloc[0] == "AT&T"
+    assert cleaned["count"].iloc[0] == 1
+
+
 def test_extract_jobdescription_info():
     df = pd.DataFrame(
         {
@@ -233,6 +386,24 @@ def test_extract_jobdescription_info():
     ]
 
 
+def test_extract_jobdescription_info_trims_dangling_words():
+    series = pd.Series(
+        [
+            "Die Stelle ist befristet mit Option auf Verlängerung.",
+            "Die Stelle ist befristet bis",
+            "befristet in Elternzeitvertretung",
+        ]
+    )
+
+    fixedterm, _, _ = extract_jobdescription_info(series)
+
+    assert fixedterm.tolist() == [
+        "befristet",
+        "befristet",
+        "befristet in Elternzeitvertretung",
+    ]
+
+
 def test_clean_dataframe_progress_callback():
     """Test that progress callback works with license plate resolution."""
     progress_calls = []
@@ -83,5 +83,66 @@ def test_generate_candidate_pairs_limits_comparisons() -> None:
     df = pd.DataFrame(data)
     pairs = generate_candidate_pairs(df, {"jobdescription"})
     # Must include the duplicate pair and be far less than full pairwise (45)
-    assert (0, 1) in pairs
+    assert [0, 1] in pairs.tolist()
     assert len(pairs) < (len(df) * (len(df) - 1)) / 2
+
+
+def test_generate_candidate_pairs_pairs_records_without_terms() -> None:
+    df = pd.DataFrame(
+        {"jobdescription": ["", None] + [f"text {i} stelle{i}" for i in range(8)]}
+    )
+    pairs = generate_candidate_pairs(df, {"jobdescription"}, n_neighbors=3)
+    partners = {0: set(), 1: set()}
+    for i, j in pairs.tolist():
+        for record, other in ((i, j), (j, i)):
+            if record in partners:
+                partners[record].add(other)
+    assert all(len(others) >= 2 for others in partners.values())
+
+
+def test_generate_candidate_pairs_independent_of_block_size(monkeypatch) -> None:
+    df = pd.DataFrame(
+        {"jobdescription": [f"stelle {i % 7} bibliothek {i % 3} ort{i}" for i in range(60)]}
+    )
+    expected = generate_candidate_pairs(df, {"jobdescription"})
+    monkeypatch.setattr("cleaning.CANDIDATE_BLOCK_NONZEROS", 50)
+    assert generate_candidate_pairs(df, {"jobdescription"}).tolist() == expected.tolist()
+
+
+def test_find_fuzzy_duplicates_keeps_one_record_per_cluster() -> None:
+    description = "Bibliothekar (m/w/d) für die Zweigstelle Ehrenfeld gesucht"
+    df = pd.DataFrame(
+        {
+            "jobdescription": [description, description, description + "."],
+            "company": ["Stadtbibliothek Köln"] * 3,
+            "location": ["Köln"] * 3,
+            "jobtype": ["Bibliothekar"] * 3,
+            "url": [None, "https://example.org/stelle", None],
+        }
+    )
+    cleaned, duplicates = find_fuzzy_duplicates(df, DEDUPLICATE_COLUMNS)
+
+    assert len(cleaned) == 1
+    assert cleaned["url"].iloc[0] == "https://example.org/stelle"
+    assert duplicates["pair_id"].nunique() == 1
+    assert duplicates.loc[duplicates["keep"], "orig_index"].tolist() == [1]
+    assert sorted(duplicates.loc[~duplicates["keep"], "orig_index"]) == [0, 2]
+
+
+def test_find_fuzzy_duplicates_rejects_different_pay_grade_suffixes() -> None:
+    description = "Bibliothekar (m/w/d) für die Zweigstelle Ehrenfeld gesucht"
+    df = pd.DataFrame(
+        {
+            "jobdescription": [description] * 3,
+            "company": ["Stadtbibliothek Köln"] * 3,
+            "salary": [
+                "Entgeltgruppe E 9A nach TV-L",
+                "Entgeltgruppe E 9B nach TV-L",
+                "Entgeltgruppe E 9B nach TV-L",
+            ],
+        }
+    )
+    cleaned, duplicates = find_fuzzy_duplicates(df, DEDUPLICATE_COLUMNS)
+
+    assert len(cleaned) == 2
+    assert sorted(duplicates["orig_index"]) == [1, 2]
@@ -129,4 +129,19 @@ def test_load_bibliojobs_handles_asterisks(tmp_path):
     loaded = load_bibliojobs(path)
 
     expected_columns = ["jobid", "company", "location", "date"]
-    assert list(loaded.columns) == expected_columns
\ No newline at end of file
+    assert list(loaded.columns) == expected_columns
+
+
+def test_load_bibliojobs_keeps_quotes_literal(tmp_path):
+    path = tmp_path / "bibliojobs.csv"
+    path.write_text(
+        '_JOBID__§__JOBDESCRIPTION__§_date\n'
+        '1_§_"Bibliothekar"_§_01-02-2020\n'
+        '2_§_Leitung "Medien_§_01-02-2020\n',
+        encoding="utf-8",
+    )
+
+    loaded = load_bibliojobs(path)
+
+    assert loaded["jobdescription"].tolist() == ['"Bibliothekar"', 'Leitung "Medien']
+    assert loaded["jobid"].tolist() == [1, 2]
@@ -77,6 +77,53 @@ def test_get_all_error_types_spelling_errors():
     assert spelling_errors[0][1] > 0
 
 
+def test_get_all_error_types_location_checks():
+    """Short alphabetic codes are cryptic, repeated characters are misspelt."""
+    series = pd.Series(["B", " HH ", "Berlin", "Mainzzzz", "123", None])
+    errors = dict(get_all_error_types(series, "location"))
+
+    assert errors["Kryptische Werte"] == pytest.approx(2 / 6 * 100)
+    assert errors["Schreibfehler"] == pytest.approx(1 / 6 * 100)
+
+
+def test_get_all_error_types_data_conflicts():
+    """Differently formatted variants of a top value count as conflicts."""
+    series = pd.Series(["Berlin"] * 3 + ["BERLIN!"] * 2 + ["Ber-lin", "Mainz"])
+    errors = dict(get_all_error_types(series, "company"))
+
+    # "Berlin" matches "BERLIN!" first, "BERLIN!" and "Ber-lin" match "Berlin"
+    assert errors["Datenkonflikte"] == pytest.approx((2 + 3 + 3) / 7 * 100)
+
+
+def test_get_all_error_types_dates_out_of_range():
+    """Dates outside 2000-2025 are contradictory, unparsable ones are ignored."""
+    text = pd.Series(["2014-12-10", "10.01.2030", "kein Datum", "1999-05-01"])
+    errors = dict(get_all_error_types(text, "date"))
+    assert errors["Widersprüchliche Werte"] == 50.0
+
+    dates = pd.Series(pd.to_datetime(["2014-12-10", "2030-01-10", None, None]))
+    errors = dict(get_all_error_types(dates, "date"))
+    assert errors["Widersprüchliche Werte"] == 25.0
+
+    offsets = pd.Series([
+        "2014-12-10T10:00:00+01:00",
+        "2015-12-10T10:00:00+02:00",
+        "2030-01-01",
+    ])
+    errors = dict(get_all_error_types(offsets, "date"))
+    assert errors["Widersprüchliche Werte"] == pytest.approx(100 / 3)
+
+
+def test_get_all_error_types_misplaced_and_wrong_values():
+    jobtype = pd.Series(["Stelle", "Stadtbibliothek Köln", "www.example.org", None])
+    errors = dict(get_all_error_types(jobtype, "jobtype"))
+    assert errors["Falsche Zuordnungen"] == 50.0
+
+    country = pd.Series(["Deutschland", "Unknown", "xxx", "Österreich"])
+    errors = dict(get_all_error_types(country, "country"))
+    assert errors["Falsche Werte"] == 50.0
+
+
 def test_get_all_error_types_no_errors():
     """Test with clean data."""
     series = pd.Series(["clean", "data", "here"])
@@ -270,4 +317,14 @@ def test_export_report_no_errors(tmp_path, monkeypatch):
         assert clean_rows.iloc[0]["Fehlertyp"] == "Keine signifikanten Fehler"
         assert clean_rows.iloc[0]["Relative Fehlerquote (%)"] == 0.0
     
-    win.close()
\ No newline at end of file
+    win.close()
+
+
+def test_profile_dataframe_ignores_unused_categories():
+    series = pd.Series(["x", "na", "x"], dtype="category")
+    series = series.cat.add_categories(["unused"])
+    profile = profile_dataframe(pd.DataFrame({"a": series}))
+    col = profile[profile["Spalte"] == "a"].iloc[0]
+    assert col["Eindeutige Werte"] == 2
+    assert col["Häufigste Fehlerart"] == "na"
+    assert col["Fehler Häufigkeit"] == 1